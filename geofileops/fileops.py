@@ -2,20 +2,26 @@
 
 import contextlib
 import enum
-import filecmp
+import functools
 import locale
 import logging
+import mmap
 import os
 import pprint
 import shutil
+import sqlite3
 import string
 import tempfile
+import threading
 import time
 import warnings
 import zipfile
-from collections.abc import Iterable
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent import futures
 from datetime import date, datetime
 from pathlib import Path
+from stat import S_IFMT, S_IFREG, S_ISDIR
 from typing import Any, Literal, Union
 
 import geopandas as gpd
@@ -42,11 +48,6 @@ from geofileops.util import (
 from geofileops.util._general_util import retry
 from geofileops.util._geopath_util import GeoPath
 
-try:
-    import fiona
-except ImportError:
-    fiona = None
-
 try:
     import pyarrow
 except ImportError:
@@ -110,6 +111,17 @@ RETRY_LOCKED_FILE_KWARGS = {
     "match": FILE_LOCKED_ERRORS,
 }
 
+# Cache for metadata read from files, e.g. the results of get_layerinfo. The keys
+# contain the file statistics (size, modification time,...) of the file(s) involved so
+# changes made by other processes are detected as well.
+_FILE_CACHE_MAXSIZE = 512
+_file_cache: OrderedDict[tuple, Any] = OrderedDict()
+_file_cache_lock = threading.Lock()
+
+# Minimum and maximum time to sleep between attempts to create a lock file.
+_LOCKFILE_MIN_SLEEP_S = 0.01
+_LOCKFILE_MAX_SLEEP_S = 1.0
+
 
 def listlayers(
     path: Union[str, "os.PathLike[Any]"], only_spatial_layers: bool = True
@@ -139,12 +151,19 @@ def listlayers(
             raise FileNotFoundError(f"File not found: {path}")
         return [GeoPath(path).stem]
 
+    cache_key = _file_cache_key(path, "listlayers", only_spatial_layers)
+    layers = _file_cache_get(cache_key)
+    if layers is not None:
+        return list(layers)
+
     datasource = None
     try:
         datasource = gdal.OpenEx(
             str(path), nOpenFlags=gdal.OF_VECTOR | gdal.OF_READONLY | gdal.OF_SHARED
         )
-        return _listlayers(datasource, only_spatial_layers)
+        layers = _listlayers(datasource, only_spatial_layers)
+        _file_cache_put(cache_key, tuple(layers))
+        return layers
 
     except Exception as ex:
         if str(ex).endswith("No such file or directory"):
@@ -284,6 +303,159 @@ class LayerInfo:
         return f"{self.__class__}({self.__dict__})"
 
 
+def _file_cache_key(
+    path: Union[str, "os.PathLike[Any]"], *args: object
+) -> tuple | None:
+    """Determine the key to cache metadata of a file with.
+
+    The key contains the statistics of the file(s) on disk, so if the file is changed
+    the key changes as well.
+
+    Args:
+        path (PathLike): path to the file.
+        *args: extra (hashable) values that should be part of the key, e.g. the name of
+            the function the metadata is cached for and its parameters.
+
+    Returns:
+        tuple, optional: the key or None if metadata of this path cannot be cached,
+            e.g. for GDAL vsi paths or if the file doesn't exist.
+    """
+    path_str = os.fspath(path)
+    if path_str.startswith("/vsi"):
+        return None
+
+    # For shapefiles the layer definition is stored in several files.
+    # For GeoPackages the changes can still be in the write-ahead log file.
+    path_p = Path(path_str)
+    paths_to_check = [path_p]
+    suffix_lower = path_p.suffix.lower()
+    if suffix_lower == ".shp":
+        suffixes = (".dbf", ".prj", ".cpg")
+        paths_to_check.extend(path_p.with_suffix(suffix) for suffix in suffixes)
+    elif suffix_lower == ".gpkg":
+        paths_to_check.append(Path(f"{path_str}-wal"))
+
+    file_stats = []
+    for index, path_to_check in enumerate(paths_to_check):
+        try:
+            stat = path_to_check.stat()
+        except OSError:
+            if index == 0:
+                # The main file doesn't exist (or isn't a local file).
+                return None
+            continue
+        file_stats.append((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+
+        # Directory based datasources (e.g. .gdb) are changed by writing to the files
+        # in the directory, so use the newest modification time of those.
+        if S_ISDIR(stat.st_mode):
+            try:
+                with os.scandir(path_to_check) as entries:
+                    entry_mtimes = [entry.stat().st_mtime_ns for entry in entries]
+            except OSError:
+                return None
+            file_stats.append((len(entry_mtimes), max(entry_mtimes, default=0)))
+
+    return (path_p.absolute(), tuple(file_stats), *args)
+
+
+def _file_cache_get(key: tuple | None) -> Any:  # noqa: ANN401
+    """Get a value from the file cache.
+
+    Args:
+        key (tuple, optional): the key as determined by `_file_cache_key`.
+
+    Returns:
+        Any: a copy of the cached value or None if it is not cached. A copy is returned
+            so changes to it by the caller don't affect the cache.
+    """
+    if key is None:
+        return None
+
+    with _file_cache_lock:
+        value = _file_cache.get(key)
+        if value is not None:
+            _file_cache.move_to_end(key)
+
+    return _copy_file_cache_value(value)
+
+
+def _file_cache_put(key: tuple | None, value: object) -> None:
+    """Add a value to the file cache.
+
+    Args:
+        key (tuple, optional): the key as determined by `_file_cache_key`. If None,
+            nothing is cached.
+        value (object): the value to cache.
+    """
+    if key is None:
+        return
+
+    value = _copy_file_cache_value(value)
+    with _file_cache_lock:
+        _file_cache[key] = value
+        if len(_file_cache) > _FILE_CACHE_MAXSIZE:
+            _file_cache.popitem(last=False)
+
+
+def _copy_file_cache_value(value: Any) -> Any:  # noqa: ANN401
+    """Copy a value that is put in or gotten from the file cache.
+
+    Only the mutable parts of a LayerInfo are copied: the crs is shared, as copying a
+    pyproj CRS is expensive and it isn't changed in place. Other values cached are
+    immutable, so they don't need to be copied.
+
+    Args:
+        value (Any): the value to copy.
+
+    Returns:
+        Any: the copy.
+    """
+    if not isinstance(value, LayerInfo):
+        return value
+
+    columns = {
+        name: ColumnInfo(
+            name=column.name,
+            gdal_type=column.gdal_type,
+            width=column.width,
+            precision=column.precision,
+        )
+        for name, column in value.columns.items()
+    }
+    return LayerInfo(
+        name=value.name,
+        featurecount=value.featurecount,
+        total_bounds=value.total_bounds,
+        geometrycolumn=value.geometrycolumn,
+        geometrytypename=value.geometrytypename,
+        columns=columns,
+        fid_column=value.fid_column,
+        crs=value.crs,
+        errors=list(value.errors),
+    )
+
+
+def _invalidate_file_cache(path: Union[str, "os.PathLike[Any]"]) -> None:
+    """Remove all cached metadata for the path specified.
+
+    This should be called by all functions that can change a file, as changes within
+    the resolution of the file modification time cannot be detected otherwise. This
+    includes the functions in `_ogr_util` and `_sqlite_util` that write to files.
+
+    Args:
+        path (PathLike): path to the file.
+    """
+    path_str = os.fspath(path)
+    if path_str.startswith("/vsi"):
+        return
+
+    path_abs = Path(path_str).absolute()
+    with _file_cache_lock:
+        for key in [key for key in _file_cache if key[0] == path_abs]:
+            del _file_cache[key]
+
+
 def get_layer_geometrytypes(
     path: Union[str, "os.PathLike[Any]"], layer: str | None = None
 ) -> list[str]:
@@ -327,6 +499,9 @@ def get_layerinfo(
 ) -> LayerInfo:
     """Get information about a layer in a geofile.
 
+    The information is cached, so calling this function repeatedly for a file that
+    didn't change is cheap.
+
     Args:
         path (PathLike): path to the file to get info about. |GDAL_vsi| paths are also
             supported.
@@ -350,6 +525,15 @@ def get_layerinfo(
         <a href="https://gdal.org/en/stable/user/virtual_file_systems.html" target="_blank">GDAL vsi</a>
 
     """  # noqa: E501
+    # If a datasource is passed, it can contain uncommitted changes, so don't cache.
+    cache_key = None
+    if datasource is None:
+        layername = layer.name if isinstance(layer, LayerInfo) else layer
+        cache_key = _file_cache_key(path, "layerinfo", layername, raise_on_nogeom)
+        layerinfo = _file_cache_get(cache_key)
+        if layerinfo is not None:
+            return layerinfo
+
     datasource_specified = datasource is not None
     try:
         if datasource is None:
@@ -363,15 +547,17 @@ def get_layerinfo(
         errors = []
         driver = datasource.GetDriver().ShortName
         layer_defn = datasource_layer.GetLayerDefn()
-        for i in range(layer_defn.GetFieldCount()):
-            name = layer_defn.GetFieldDefn(i).GetName()
+        illegal_column_chars = ['"']
+        for field_defn in [
+            layer_defn.GetFieldDefn(i) for i in range(layer_defn.GetFieldCount())
+        ]:
+            name = field_defn.GetName()
             # TODO: think whether the type name should be converted to other names
-            gdal_type = layer_defn.GetFieldDefn(i).GetTypeName()
-            width = layer_defn.GetFieldDefn(i).GetWidth()
+            gdal_type = field_defn.GetTypeName()
+            width = field_defn.GetWidth()
             width = width if width > 0 else None
-            precision = layer_defn.GetFieldDefn(i).GetPrecision()
+            precision = field_defn.GetPrecision()
             precision = precision if precision > 0 else None
-            illegal_column_chars = ['"']
             for illegal_char in illegal_column_chars:
                 if illegal_char in name:
                     errors.append(
@@ -429,7 +615,7 @@ def get_layerinfo(
         # end, but this is not an error! If it isn't there, using the layer name in SQL
         # statements on the ".shp.zip" file will lead to "table not found" errors.
         if len(errors) == 0:
-            return LayerInfo(
+            layerinfo = LayerInfo(
                 name=datasource_layer.GetName(),
                 featurecount=datasource_layer.GetFeatureCount(),
                 total_bounds=total_bounds,  # type: ignore[arg-type]
@@ -440,6 +626,8 @@ def get_layerinfo(
                 crs=crs,
                 errors=errors,
             )
+            _file_cache_put(cache_key, layerinfo)
+            return layerinfo
 
     except Exception as ex:
         if str(ex).endswith("No such file or directory"):
@@ -459,6 +647,61 @@ def get_layerinfo(
     )
 
 
+def get_layerinfos(
+    paths: Iterable[Union[str, "os.PathLike[Any]"]],
+    layer: str | None = None,
+    raise_on_nogeom: bool = True,
+    max_workers: int | None = None,
+) -> list[LayerInfo]:
+    """Get information about a layer in each of the geofiles specified.
+
+    The files are read concurrently using threads, so the latency of opening the files
+    overlaps. This is mainly useful for many files or for files on a network drive.
+
+    Args:
+        paths (Iterable[PathLike]): paths to the files to get info about. |GDAL_vsi|
+            paths are also supported.
+        layer (str, optional): the layer you want info about. Doesn't need to be
+            specified if there is only one layer in the geofiles.
+        raise_on_nogeom (bool, optional): True to raise if the layer doesn't have a
+            geometry column. If False, the returned LayerInfo.geometrycolumn will be
+            None. Defaults to True.
+        max_workers (int, optional): the maximum number of threads to use. If None,
+            twice the number of CPUs is used. Defaults to None.
+
+    Raises:
+        ValueError if the layer definition has errors like invalid column names,...
+
+    Returns:
+        list[LayerInfo]: the information about the layers, in the order of `paths`.
+
+    See Also:
+        * :func:`get_layerinfo`: get information about a layer in a single geofile
+
+    .. |GDAL_vsi| raw:: html
+
+        <a href="https://gdal.org/en/stable/user/virtual_file_systems.html" target="_blank">GDAL vsi</a>
+
+    """  # noqa: E501
+    paths = list(paths)
+    if len(paths) == 0:
+        return []
+    if max_workers is None:
+        max_workers = (os.cpu_count() or 1) * 2
+    max_workers = min(max_workers, len(paths))
+
+    # Each thread opens its own datasource, which is safe in gdal.
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures_list = [
+            pool.submit(
+                get_layerinfo, path, layer=layer, raise_on_nogeom=raise_on_nogeom
+            )
+            for path in paths
+        ]
+
+    return [future.result() for future in futures_list]
+
+
 def get_only_layer(path: Union[str, "os.PathLike[Any]"]) -> str:
     """Get the layername for a file that only contains one layer.
 
@@ -478,12 +721,18 @@ def get_only_layer(path: Union[str, "os.PathLike[Any]"]) -> str:
         <a href="https://gdal.org/en/stable/user/virtual_file_systems.html" target="_blank">GDAL vsi</a>
 
     """  # noqa: E501
+    cache_key = _file_cache_key(path, "get_only_layer")
+    layer = _file_cache_get(cache_key)
+    if layer is not None:
+        return layer
+
     try:
         datasource = gdal.OpenEx(
             str(path), nOpenFlags=gdal.OF_VECTOR | gdal.OF_READONLY | gdal.OF_SHARED
         )
-
-        return _get_only_layer(datasource).GetName()
+        layer = _get_only_layer(datasource).GetName()
+        _file_cache_put(cache_key, layer)
+        return layer
 
     except Exception as ex:
         if str(ex).endswith("No such file or directory"):
@@ -615,6 +864,7 @@ def execute_sql(
         raise
     finally:
         datasource = None
+        _invalidate_file_cache(path)
 
 
 @retry(**RETRY_LOCKED_FILE_KWARGS)  # type: ignore[arg-type]
@@ -658,6 +908,8 @@ def create_spatial_index(
 
     # Add index
     path_info = _geofileinfo.get_geofileinfo(path)
+    index_created = None
+    datasource = None
     try:
         # Use has_spatial_index up-front to check if there is an index. To avoid needing
         # R/W permissions, don't open the file in update mode yet.
@@ -681,12 +933,22 @@ def create_spatial_index(
 
             if path_info.is_spatialite_based:
                 geometrycolumn = layer.geometrycolumn
-                sql = f"SELECT CreateSpatialIndex('{layer.name}', '{geometrycolumn}')"
+                sql = (
+                    "SELECT CreateSpatialIndex("
+                    f"{_ogr_sql_util.quote_string(layer.name)}, "
+                    f"{_ogr_sql_util.quote_string(geometrycolumn)})"
+                )
                 result = datasource.ExecuteSQL(sql, dialect="SQLITE")
                 datasource.ReleaseResultSet(result)
+
+                # Check the result using the open datasource to avoid reopening it
+                index_created = has_spatial_index(path, layer, datasource=datasource)
             else:
+                layer_quoted = _ogr_sql_util.quote_identifier(
+                    layer.name, dialect="OGRSQL"
+                )
                 result = datasource.ExecuteSQL(
-                    f'CREATE SPATIAL INDEX ON "{layer.name}"'
+                    f"CREATE SPATIAL INDEX ON {layer_quoted}"
                 )
                 datasource.ReleaseResultSet(result)
 
@@ -701,9 +963,14 @@ def create_spatial_index(
             ex.args = (f"create_spatial_index error: {ex}, for {path}#{layer.name}",)
         raise
     finally:
-        datasource = None
+        # Only invalidate the cache if the file was opened to write the index.
+        if datasource is not None:
+            datasource = None
+            _invalidate_file_cache(path)
 
-    if not has_spatial_index(path, layer.name):
+    if index_created is None:
+        index_created = has_spatial_index(path, layer.name)
+    if not index_created:
         raise RuntimeError(f"create_spatial_index failed on {path}#{layer.name}")
 
 
@@ -733,6 +1000,27 @@ def has_spatial_index(
     datasource_specified = datasource is not None
     try:
         path_info = _geofileinfo.get_geofileinfo(path)
+        if (
+            path_info.driver == "GPKG"
+            and not datasource_specified
+            and layer is not None
+            and Path(path).suffix.lower() == ".gpkg"
+            and Path(path).exists()
+        ):
+            # For a GPKG file, check directly in the gpkg metadata tables: this is a
+            # lot faster than opening the file with gdal. If this fails, e.g. because
+            # the gpkg metadata tables don't exist, fall back to the check via gdal.
+            layername = layer.name if isinstance(layer, LayerInfo) else layer
+            try:
+                has_index = _sqlite_util.has_gpkg_rtree_index(Path(path), layername)
+            except RuntimeError as ex:
+                if not isinstance(ex.__cause__, sqlite3.OperationalError):
+                    raise
+                logger.debug(f"Check spatial index in sqlite failed, use gdal: {ex}")
+                has_index = None
+            if has_index is not None:
+                return has_index
+
         if path_info.is_spatialite_based:
             if datasource is None:
                 datasource = gdal.OpenEx(
@@ -753,7 +1041,11 @@ def has_spatial_index(
             if geometrycolumn == "":
                 geometrycolumn = "geometry"
 
-            sql = f"SELECT HasSpatialIndex('{layername}', '{geometrycolumn}')"
+            sql = (
+                "SELECT HasSpatialIndex("
+                f"{_ogr_sql_util.quote_string(layername)}, "
+                f"{_ogr_sql_util.quote_string(geometrycolumn)})"
+            )
             result = datasource.ExecuteSQL(sql, dialect="SQLITE")
             has_spatial_index = result.GetNextFeature().GetField(0) == 1
             datasource.ReleaseResultSet(result)
@@ -817,7 +1109,8 @@ def remove_spatial_index(
         ):
             result = datasource.ExecuteSQL(
                 "SELECT DisableSpatialIndex("
-                f"      '{layer.name}', '{layer.geometrycolumn}')",
+                f"{_ogr_sql_util.quote_string(layer.name)}, "
+                f"{_ogr_sql_util.quote_string(layer.geometrycolumn)})",
                 dialect="SQLITE",
             )
             datasource.ReleaseResultSet(result)
@@ -841,6 +1134,7 @@ def remove_spatial_index(
         if not datasource_specified:
             # Close the datasource if it wasn't passed in as a parameter
             datasource = None
+        _invalidate_file_cache(path)
 
 
 @retry(**RETRY_LOCKED_FILE_KWARGS)  # type: ignore[arg-type]
@@ -894,6 +1188,7 @@ def rename_layer(
         raise
     finally:
         datasource = None
+        _invalidate_file_cache(path)
 
 
 @retry(**RETRY_LOCKED_FILE_KWARGS)  # type: ignore[arg-type]
@@ -973,6 +1268,7 @@ def rename_column(
 
     finally:
         datasource = None
+        _invalidate_file_cache(path)
 
 
 class DataType(enum.Enum):
@@ -1099,7 +1395,20 @@ def add_column(
     layerinfo = get_layerinfo(path, layer, raise_on_nogeom=False)
     layer = layerinfo.name
 
+    # The ALTER and UPDATE are executed in a single transaction. For spatialite based
+    # files, use a large cache and keep temporary data in memory while updating.
+    config_options: dict[str, Any] = {}
+    if expression is not None:
+        config_options = {
+            "OGR_SQLITE_CACHE": 128,
+            "OGR_SQLITE_PRAGMA": "temp_store=MEMORY",
+        }
+
     # Go!
+    # The ALTER TABLE is executed in the native sql dialect of the file.
+    alter_dialect = _native_sql_dialect(path)
+    layer_quoted = _ogr_sql_util.quote_identifier(layer)
+    name_quoted = _ogr_sql_util.quote_identifier(name)
     datasource = None
     try:
         # If column doesn't exist yet, create it
@@ -1108,9 +1417,12 @@ def add_column(
             logger.info(f"Add column {name} to {path}#{layer}")
             width_str = f"({width})" if width is not None else ""
             sql_stmt = (
-                f'ALTER TABLE "{layer}" ADD COLUMN "{name}" {type_str}{width_str}'
+                f"ALTER TABLE {_ogr_sql_util.quote_identifier(layer, alter_dialect)} "
+                f"ADD COLUMN {_ogr_sql_util.quote_identifier(name, alter_dialect)} "
+                f"{type_str}{width_str}"
             )
-            datasource = gdal.OpenEx(str(path), nOpenFlags=gdal.OF_UPDATE)
+            with _ogr_util.set_config_options(config_options):
+                datasource = gdal.OpenEx(str(path), nOpenFlags=gdal.OF_UPDATE)
             _ogr_util.StartTransaction(datasource)
             datasource.ExecuteSQL(sql_stmt)
         else:
@@ -1121,15 +1433,18 @@ def add_column(
             name not in layerinfo.columns or force_update is True
         ):
             if datasource is None:
-                datasource = gdal.OpenEx(str(path), nOpenFlags=gdal.OF_UPDATE)
+                with _ogr_util.set_config_options(config_options):
+                    datasource = gdal.OpenEx(str(path), nOpenFlags=gdal.OF_UPDATE)
                 _ogr_util.StartTransaction(datasource)
-            sql_stmt = f'UPDATE "{layer}" SET "{name}" = {expression}'
+            sql_stmt = f"UPDATE {layer_quoted} SET {name_quoted} = {expression}"
             datasource.ExecuteSQL(sql_stmt, dialect="SQLITE")
 
         _ogr_util.CommitTransaction(datasource)
 
         # check if column was really added
-        datasource = gdal.OpenEx(str(path), nOpenFlags=gdal.OF_UPDATE)
+        datasource = gdal.OpenEx(
+            str(path), nOpenFlags=gdal.OF_VECTOR | gdal.OF_READONLY
+        )
         datasource_layer = datasource.GetLayer(layer)
         layer_defn = datasource_layer.GetLayerDefn()
         field_index = layer_defn.GetFieldIndex(name)
@@ -1144,6 +1459,7 @@ def add_column(
         raise
     finally:
         datasource = None
+        _invalidate_file_cache(path)
 
         # Log time taken if it was slow.
         took = time.perf_counter() - start
@@ -1327,7 +1643,9 @@ def add_columns(
                 expression = new_column[2] if len(new_column) >= 3 else None
 
                 if expression is not None:
-                    update_set_expressions.append(f'"{name}" = {expression}')
+                    update_set_expressions.append(
+                        f"{_ogr_sql_util.quote_identifier(name)} = {expression}"
+                    )
 
                 if name.upper() in columns_upper:
                     logger.warning(f"Column {name} existed already in {path}#{layer}")
@@ -1336,7 +1654,13 @@ def add_columns(
                 column_added = True
 
                 # Open datasource if not opened yet
-                sql_stmt = f'ALTER TABLE "{layer}" ADD COLUMN "{name}" {type_str}'
+                alter_dialect = _native_sql_dialect(output_tmp_path)
+                sql_stmt = (
+                    "ALTER TABLE "
+                    f"{_ogr_sql_util.quote_identifier(layer, alter_dialect)} "
+                    "ADD COLUMN "
+                    f"{_ogr_sql_util.quote_identifier(name, alter_dialect)} {type_str}"
+                )
                 datasource.ExecuteSQL(sql_stmt)
 
             # check if the columns were really added
@@ -1356,7 +1680,7 @@ def add_columns(
             if len(update_set_expressions) > 0 and (column_added or force_update):
                 set_expr = "\n,".join(update_set_expressions)
                 sql_stmt = f"""
-                    UPDATE "{layer}"
+                    UPDATE {_ogr_sql_util.quote_identifier(layer)}
                        SET {set_expr}
                 """
                 datasource.ExecuteSQL(sql_stmt, dialect="SQLITE")
@@ -1410,6 +1734,7 @@ def add_columns(
 
         finally:
             datasource = None
+            _invalidate_file_cache(output_tmp_path)
 
             # Log time taken if it was slow.
             took = time.perf_counter() - start
@@ -1417,6 +1742,14 @@ def add_columns(
                 logger.info(f"Ready, add_columns of {name} took {took:.2f}")
 
 
+def _native_sql_dialect(path: Union[str, "os.PathLike[Any]"]) -> str:
+    """Get the sql dialect gdal uses to execute sql statements on a file by default."""
+    if _geofileinfo.get_geofileinfo(path).is_spatialite_based:
+        return "SQLITE"
+
+    return "OGRSQL"
+
+
 def _validate_datatype(datatype: str | DataType) -> str:
     """Validate the datatype specified for a column.
 
@@ -1477,7 +1810,11 @@ def drop_column(
     # Now really rename
     try:
         datasource = gdal.OpenEx(str(path), nOpenFlags=gdal.OF_UPDATE)
-        sql_stmt = f'ALTER TABLE "{layer}" DROP COLUMN "{column_name}"'
+        dialect = _native_sql_dialect(path)
+        sql_stmt = (
+            f"ALTER TABLE {_ogr_sql_util.quote_identifier(layer, dialect)} "
+            f"DROP COLUMN {_ogr_sql_util.quote_identifier(column_name, dialect)}"
+        )
         result = datasource.ExecuteSQL(sql_stmt)
         datasource.ReleaseResultSet(result)
 
@@ -1486,6 +1823,7 @@ def drop_column(
         raise
     finally:
         datasource = None
+        _invalidate_file_cache(path)
 
 
 @retry(**RETRY_LOCKED_FILE_KWARGS)  # type: ignore[arg-type]
@@ -1570,7 +1908,10 @@ def update_column(
     # Go!
     try:
         datasource = gdal.OpenEx(str(path), nOpenFlags=gdal.OF_UPDATE)
-        sqlite_stmt = f'UPDATE "{layerinfo.name}" SET "{name}" = {expression}'
+        sqlite_stmt = (
+            f"UPDATE {_ogr_sql_util.quote_identifier(layerinfo.name)} "
+            f"SET {_ogr_sql_util.quote_identifier(name)} = {expression}"
+        )
         if where is not None:
             sqlite_stmt += f"\n WHERE {where}"
         result = datasource.ExecuteSQL(sqlite_stmt, dialect="SQLITE")
@@ -1581,6 +1922,7 @@ def update_column(
         raise
     finally:
         datasource = None
+        _invalidate_file_cache(path)
 
         # Log time taken if it was slow.
         took = time.perf_counter() - start
@@ -1928,11 +2270,14 @@ def _read_file_base_fiona(
         float_cols = list(result_gdf.select_dtypes(["float64"]).columns)
         if len(float_cols) > 0:
             # Check for all float columns found if they should be object columns instead
-            if fiona is None:
+            # fiona is deprecated, so only import it when it is actually used.
+            try:
+                import fiona  # noqa: PLC0415
+            except ImportError as ex:
                 raise ImportError(
                     "fiona is not installed, but needed to read the file with"
                     " GFO_IO_ENGINE=fiona. Please install fiona."
-                )
+                ) from ex
 
             with fiona.open(path, layer=layer) as collection:
                 assert collection.schema is not None
@@ -2292,7 +2637,7 @@ def to_file(
             del kwargs["use_arrow"]
         else:
             use_arrow = True if pyarrow and engine.endswith("-arrow") else False
-        return _to_file_pyogrio(
+        _to_file_pyogrio(
             gdf=gdf,
             path=path,
             layer=layer,
@@ -2305,7 +2650,7 @@ def to_file(
             **kwargs,
         )
     elif engine == "fiona":
-        return _to_file_fiona(
+        _to_file_fiona(
             gdf=gdf,
             path=path,
             layer=layer,
@@ -2320,6 +2665,8 @@ def to_file(
     else:
         raise ValueError(f"Unsupported engine: {engine}")
 
+    _invalidate_file_cache(path)
+
 
 def _to_file_fiona(
     gdf: pd.DataFrame | gpd.GeoDataFrame,
@@ -2455,6 +2802,7 @@ def _to_file_fiona(
         # simultanously to them, so use lock file to synchronize access.
         lockfile = Path(f"{path!s}.lock")
         start_time = datetime.now()
+        sleep_s = _LOCKFILE_MIN_SLEEP_S
         ready = False
         while not ready:
             if _io_util.create_file_atomic(lockfile) is True:
@@ -2489,8 +2837,9 @@ def _to_file_fiona(
                         f"to {path}!"
                     )
 
-            # Sleep for a second before trying again
-            time.sleep(1)
+                # Sleep a bit before trying again, longer the longer we wait
+                time.sleep(sleep_s)
+                sleep_s = min(sleep_s * 2, _LOCKFILE_MAX_SLEEP_S)
 
 
 def _to_file_pyogrio(
@@ -2562,8 +2911,14 @@ def _to_file_pyogrio(
 
     # Temp fix for bug in pyogrio 0.7.2 (https://github.com/geopandas/pyogrio/pull/324)
     # Logic based on geopandas.to_file
-    if list(gdf.index.names) == [None] and is_integer_dtype(gdf.index.dtype):
-        gdf = gdf.reset_index(drop=True)
+    if (
+        list(gdf.index.names) == [None]
+        and is_integer_dtype(gdf.index.dtype)
+        and not gdf.index.equals(pd.RangeIndex(len(gdf)))
+    ):
+        # Only replace the index on a shallow copy, so the data isn't copied.
+        gdf = gdf.copy(deep=False)
+        gdf.index = pd.RangeIndex(len(gdf))
 
     # Now we can write
     # If there is no geometry column in the input, never create a spatial index.
@@ -2585,6 +2940,9 @@ def get_crs(
 ) -> pyproj.CRS | None:
     """Get the CRS (projection) of the file.
 
+    The result is cached, so repeated calls on an unchanged file don't need to read the
+    file again.
+
     Args:
         path (PathLike): path to the file. |GDAL_vsi| paths are supported.
         layer (Optional[str]): layer name. If not specified, and there is only
@@ -2601,6 +2959,12 @@ def get_crs(
         <a href="https://gdal.org/en/stable/user/virtual_file_systems.html" target="_blank">GDAL vsi</a>
 
     """  # noqa: E501
+    # If the crs is cached, return it
+    cache_key = _file_cache_key(path, "crs", layer, min_confidence)
+    crs = _file_cache_get(cache_key)
+    if crs is not None:
+        return crs
+
     # Check input parameters
     crs = None
     try:
@@ -2626,6 +2990,9 @@ def get_crs(
     finally:
         datasource = None
 
+    if crs is not None:
+        _file_cache_put(cache_key, crs)
+
     return crs
 
 
@@ -2740,19 +3107,137 @@ def cmp(
     path1 = Path(path1)
     path2 = Path(path2)
 
+    if path1.suffix.lower() != ".shp":
+        return _files_equal(path1, path2)
+
     # For a shapefile, multiple files need to be compared
-    if path1.suffix.lower() == ".shp":
-        shapefile_base_suffixes = [".shp", ".dbf", ".shx"]
-        for suffix in shapefile_base_suffixes:
-            if not filecmp.cmp(path1.with_suffix(suffix), path2.with_suffix(suffix)):
-                logger.info(
-                    f"File {path1.with_suffix(suffix)} is different from "
-                    f"{path2.with_suffix(suffix)}"
-                )
+    shapefile_base_suffixes = [".shp", ".dbf", ".shx"]
+    files_to_compare = [
+        (path1.with_suffix(suffix), path2.with_suffix(suffix))
+        for suffix in shapefile_base_suffixes
+    ]
+
+    # If the file sizes are different, the files are different for sure
+    files_stats = []
+    for file1, file2 in files_to_compare:
+        stat1 = file1.stat()
+        stat2 = file2.stat()
+        if stat1.st_size != stat2.st_size:
+            logger.info(f"File {file1} is different from {file2}")
+            return False
+        files_stats.append((file1, file2, stat1, stat2))
+
+    # Compare the file contents concurrently, stop as soon as a difference is found
+    # Remark: pass the stats determined already, so the files aren't stat-ed again.
+    pool = futures.ThreadPoolExecutor(max_workers=len(files_to_compare))
+    try:
+        future_to_files = {
+            pool.submit(_files_equal, file1, file2, stat1=stat1, stat2=stat2): (
+                file1,
+                file2,
+            )
+            for file1, file2, stat1, stat2 in files_stats
+        }
+        for future in futures.as_completed(future_to_files):
+            if not future.result():
+                file1, file2 = future_to_files[future]
+                logger.info(f"File {file1} is different from {file2}")
                 return False
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    return True
+
+
+def _copyfile(src: Path, dst: Path, keep_permissions: bool) -> None:
+    """Copy the contents of a file, and optionally its permissions.
+
+    If supported, `os.copy_file_range` is used so the copy is done by the file system
+    itself: file systems supporting copy-on-write (e.g. btrfs, XFS) can then share the
+    data blocks and network file systems can copy the data server-side. If this is not
+    possible, `shutil.copyfile` is used.
+
+    Args:
+        src (Path): the file to copy.
+        dst (Path): the destination file.
+        keep_permissions (bool): True to also copy the file permissions.
+    """
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        try:
+            with src.open("rb") as src_file, dst.open("wb") as dst_file:
+                to_copy = os.fstat(src_file.fileno()).st_size
+                while to_copy > 0:
+                    nb_copied = os.copy_file_range(
+                        src_file.fileno(), dst_file.fileno(), to_copy
+                    )
+                    if nb_copied == 0:
+                        break
+                    to_copy -= nb_copied
+                copied = to_copy == 0
+        except OSError:
+            # E.g. copying between file systems is not supported on older kernels
+            copied = False
+
+    if not copied:
+        shutil.copyfile(src, dst)
+    if keep_permissions:
+        shutil.copymode(src, dst)
+
+
+def _files_equal(
+    path1: Path,
+    path2: Path,
+    chunksize: int = 8 * 1024 * 1024,
+    stat1: os.stat_result | None = None,
+    stat2: os.stat_result | None = None,
+) -> bool:
+    """Compare if two files are identical.
+
+    Like `filecmp.cmp`, files with identical type, size and modification time are
+    considered identical without comparing their contents. Otherwise the contents are
+    compared using memory mapping and large chunks, which is a lot faster for large
+    files than the small buffers used by `filecmp.cmp`.
+
+    Args:
+        path1 (Path): path to the first file.
+        path2 (Path): path to the second file.
+        chunksize (int, optional): the size of the chunks to compare in bytes.
+            Defaults to 8 MB.
+        stat1 (os.stat_result, optional): the result of `stat` on `path1` if it was
+            determined already. Defaults to None.
+        stat2 (os.stat_result, optional): the result of `stat` on `path2` if it was
+            determined already. Defaults to None.
+
+    Returns:
+        bool: True if the files are identical.
+    """
+    stat1 = stat1 or path1.stat()
+    stat2 = stat2 or path2.stat()
+    file_type1 = S_IFMT(stat1.st_mode)
+    file_type2 = S_IFMT(stat2.st_mode)
+    if file_type1 != S_IFREG or file_type2 != S_IFREG:
+        # Like filecmp.cmp, only regular files can be identical
+        return False
+    if stat1.st_size != stat2.st_size:
+        return False
+    if stat1.st_mtime == stat2.st_mtime:
         return True
-    else:
-        return filecmp.cmp(str(path1), str(path2))
+    if stat1.st_size == 0:
+        # Empty files cannot be memory mapped
+        return True
+
+    with (
+        path1.open("rb") as file1,
+        path2.open("rb") as file2,
+        mmap.mmap(file1.fileno(), 0, access=mmap.ACCESS_READ) as map1,
+        mmap.mmap(file2.fileno(), 0, access=mmap.ACCESS_READ) as map2,
+    ):
+        for offset in range(0, stat1.st_size, chunksize):
+            if map1[offset : offset + chunksize] != map2[offset : offset + chunksize]:
+                return False
+
+    return True
 
 
 def copy(
@@ -2783,29 +3268,27 @@ def copy(
         raise FileNotFoundError(f"File not found: {src}")
 
     src_info = _geofileinfo.get_geofileinfo(src)
+    copy_function = functools.partial(_copyfile, keep_permissions=keep_permissions)
 
     # Copy the main file
-    if keep_permissions:
-        shutil.copy(str(src), dst)
-    else:
-        dstfile = dst / src.name if dst.is_dir() else dst
-        shutil.copyfile(src, dstfile)
+    dst_is_dir = dst.is_dir()
+    dst_main = dst / src.name if dst_is_dir else dst
+    files_to_copy = [(src, dst_main)]
 
     # For some file types, extra files need to be copied
-    # If dest is a dir, just use move. Otherwise concat dest filepaths
-
-    for suffix in src_info.suffixes_extrafiles:
-        srcfile = src.parent / f"{src.stem}{suffix}"
-        dstfile = (
-            dst / f"{src.stem}{suffix}"
-            if dst.is_dir()
-            else dst.parent / f"{dst.stem}{suffix}"
-        )
-        if srcfile.exists() and not dstfile.exists():
-            if keep_permissions:
-                shutil.copy(str(srcfile), dstfile)
-            else:
-                shutil.copyfile(srcfile, dstfile)
+    src_extrafiles = _existing_extrafiles(src, src_info.suffixes_extrafiles)
+    dst_extrafiles = _existing_extrafiles(dst_main, src_info.suffixes_extrafiles)
+    for suffix, srcfile in src_extrafiles.items():
+        if src.suffix.lower() == suffix or suffix in dst_extrafiles:
+            # Skip the main file, it is already in the list
+            # Skip extra files that already exist in the destination
+            continue
+
+        dstfile = dst_main.parent / f"{dst_main.stem}{suffix}"
+        files_to_copy.append((srcfile, dstfile))
+
+    _run_file_operations(copy_function, files_to_copy)
+    _invalidate_file_cache(dst_main)
 
 
 def move(
@@ -2827,12 +3310,13 @@ def move(
 
     # For some file types, extra files need to be moved
     dst_is_dir = dst.is_dir()
-    for suffix in src_info.suffixes_extrafiles:
+    files_to_move = []
+    src_extrafiles = _existing_extrafiles(src, src_info.suffixes_extrafiles)
+    for suffix, srcfile in src_extrafiles.items():
         if src.suffix.lower() == suffix:
             # Skip the main file, as it should be moved last
             continue
 
-        srcfile = src.parent / f"{src.stem}{suffix}"
         if dst_is_dir:
             # If the destination is a dir, we can just move the extra files to the dir
             dst_tmp = dst
@@ -2840,12 +3324,15 @@ def move(
             # If dst is not a dir concat dest filepath...
             dst_tmp = dst.parent / f"{dst.stem}{suffix}"
 
-        if srcfile.exists():
-            shutil.move(str(srcfile), dst_tmp)
+        files_to_move.append((str(srcfile), dst_tmp))
+
+    _run_file_operations(shutil.move, files_to_move)
 
     # Move the main file last, so that checks if the geofile exists are only
     # True once all files have been moved.
     shutil.move(str(src), dst)
+    _invalidate_file_cache(src)
+    _invalidate_file_cache(dst / src.name if dst_is_dir else dst)
 
 
 def remove(path: Union[str, "os.PathLike[Any]"], missing_ok: bool = False) -> None:
@@ -2871,9 +3358,82 @@ def remove(path: Union[str, "os.PathLike[Any]"], missing_ok: bool = False) -> No
     path.unlink(missing_ok=missing_ok)
 
     # For some file types, extra files need to be removed
-    for suffix in path_info.suffixes_extrafiles:
-        curr_path = path.parent / f"{path.stem}{suffix}"
-        curr_path.unlink(missing_ok=True)
+    files_to_remove = [
+        (extrafile,)
+        for extrafile in _existing_extrafiles(
+            path, path_info.suffixes_extrafiles
+        ).values()
+    ]
+    _run_file_operations(
+        functools.partial(Path.unlink, missing_ok=True), files_to_remove
+    )
+
+    _invalidate_file_cache(path)
+
+
+def _existing_extrafiles(path: Path, suffixes: Iterable[str]) -> dict[str, Path]:
+    """Determine which of the extra files of a geofile exist.
+
+    The directory is listed once instead of checking the existence of each extra
+    file separately, which saves a lot of file system calls on e.g. network drives.
+
+    File names are matched case-insensitively, as they would be by `Path.exists()` on
+    case-insensitive file systems (e.g. Windows, macOS). If multiple files only differ
+    in case, the one matching the case of the path specified is preferred.
+
+    Args:
+        path (Path): the path to the main file of the geofile.
+        suffixes (Iterable[str]): the suffixes of the extra files to look for.
+
+    Returns:
+        dict[str, Path]: for each suffix for which an extra file exists, the actual path
+            of that file.
+    """
+    wanted = {f"{path.stem}{suffix}".casefold(): suffix for suffix in suffixes}
+    if not wanted:
+        return {}
+
+    existing: dict[str, Path] = {}
+    try:
+        with os.scandir(path.parent) as entries:
+            for entry in entries:
+                suffix = wanted.get(entry.name.casefold())
+                if suffix is None:
+                    continue
+                # An exact match has priority over a case-insensitive one
+                if suffix not in existing or entry.name == f"{path.stem}{suffix}":
+                    existing[suffix] = path.parent / entry.name
+    except FileNotFoundError:
+        return {}
+
+    return existing
+
+
+def _run_file_operations(operation: Callable, args_list: list[tuple]) -> None:
+    """Run a file operation (copy, move, unlink,...) on multiple files concurrently.
+
+    The operations are independent of each other, so running them concurrently lets
+    the blocking file system calls overlap. This is mainly useful on network drives,
+    where the latency per file operation is high.
+
+    Args:
+        operation (Callable): the file operation to run.
+        args_list (list[tuple]): for each file, the arguments to pass to `operation`.
+
+    Raises:
+        Exception: the first exception raised by one of the operations, after all
+            operations are finished.
+    """
+    if len(args_list) <= 1:
+        for args in args_list:
+            operation(*args)
+        return
+
+    with futures.ThreadPoolExecutor(max_workers=len(args_list)) as pool:
+        futures_list = [pool.submit(operation, *args) for args in args_list]
+
+    for future in futures_list:
+        future.result()
 
 
 def append_to(
@@ -2925,6 +3485,7 @@ def append_to(
 
     # Creating lockfile and append
     start_time = datetime.now()
+    sleep_s = _LOCKFILE_MIN_SLEEP_S
     ready = False
     while not ready:
         if _io_util.create_file_atomic(lockfile):
@@ -2962,8 +3523,9 @@ def append_to(
                     f"to {dst}!"
                 )
 
-        # Sleep for a second before trying again
-        time.sleep(1)
+            # Sleep a bit before trying again, longer the longer we wait
+            time.sleep(sleep_s)
+            sleep_s = min(sleep_s * 2, _LOCKFILE_MAX_SLEEP_S)
 
 
 def convert(
@@ -3180,7 +3742,6 @@ def copy_layer(
 
     """  # noqa: E501
     # The append parameter is deprecated, but keep backwards compatibility
-    options = options or {}
     if append:
         if write_mode != "create":
             raise ValueError("append parameter is deprecated, use write_mode='append'")
@@ -3191,6 +3752,64 @@ def copy_layer(
         )
         write_mode = "append"
 
+    _copy_layer(
+        src=src,
+        dst=dst,
+        src_layer=src_layer,
+        dst_layer=dst_layer,
+        write_mode=write_mode,
+        src_crs=src_crs,
+        dst_crs=dst_crs,
+        columns=columns,
+        where=where,
+        sql_stmt=sql_stmt,
+        sql_dialect=sql_dialect,
+        reproject=reproject,
+        explodecollections=explodecollections,
+        force_output_geometrytype=force_output_geometrytype,
+        create_spatial_index=create_spatial_index,
+        transaction_size=transaction_size,
+        preserve_fid=preserve_fid,
+        dst_dimensions=dst_dimensions,
+        options=options,
+        force=force,
+    )
+
+
+def _copy_layer(
+    src: Union[str, "os.PathLike[Any]"],
+    dst: Union[str, "os.PathLike[Any]"],
+    src_layer: str | LayerInfo | None = None,
+    dst_layer: str | None = None,
+    write_mode: Literal[
+        "create", "add_layer", "append", "append_add_fields"
+    ] = "create",
+    src_crs: str | int | None = None,
+    dst_crs: str | int | None = None,
+    columns: Iterable[str] | None = None,
+    where: str | None = None,
+    sql_stmt: str | None = None,
+    sql_dialect: Literal["SQLITE", "OGRSQL"] | None = None,
+    reproject: bool = False,
+    explodecollections: bool = False,
+    force_output_geometrytype: GeometryType | str | None = None,
+    create_spatial_index: bool | None = None,
+    transaction_size: int = 50000,
+    preserve_fid: bool | None = None,
+    dst_dimensions: str | None = None,
+    options: dict | None = None,
+    force: bool = False,
+    profile: _sqlite_util.SqliteProfile = _sqlite_util.SqliteProfile.DEFAULT,
+) -> None:
+    """Copy a layer from a source to a destination dataset, see :func:`copy_layer`.
+
+    `profile` is the sqlite profile to use if the data is appended directly in sqlite.
+    Only use SqliteProfile.SPEED if the destination file can be discarded if something
+    goes wrong: if the direct copy fails with this profile, the error is raised instead
+    of retrying the copy with gdal.
+    """
+    options = options or {}
+
     # Determine the access mode and whether to add missing fields when appending
     add_fields = False
     access_mode = _determine_access_mode(dst, dst_layer, write_mode, force)
@@ -3259,10 +3878,18 @@ def copy_layer(
                 columns=columns,
                 where=where,
                 preserve_fid=preserve_fid_local,
+                profile=profile,
             )
+            _invalidate_file_cache(dst)
             return
 
         except Exception as ex:
+            if profile == _sqlite_util.SqliteProfile.SPEED:
+                # Without journal a failed copy can't be rolled back, so the data
+                # might be partially copied already: retrying could duplicate rows.
+                _invalidate_file_cache(dst)
+                raise
+
             logger.info(
                 f"Failed to copy data directly in sqlite, retry with gdal: {ex}"
             )
@@ -3339,6 +3966,7 @@ def copy_layer(
         add_fields=add_fields,
     )
     _ogr_util.vector_translate_by_info(info=translate_info)
+    _invalidate_file_cache(dst)
 
 
 def zip_geofile(
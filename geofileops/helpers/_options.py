@@ -490,6 +490,71 @@ class ConfigOptions:
         """
         return _get_bool("GFO_REMOVE_TEMP_FILES", default=True)
 
+    @staticmethod
+    def set_reuse_worker_pool(enable: bool | None) -> _RestoreOriginalHandler:
+        """Enable or disable reusing the worker processes between operations.
+
+        If not set, the option is disabled by default, so the worker processes are
+        started for each operation and stopped again when the operation is ready.
+
+        Starting worker processes has a fixed cost, so when many short operations are
+        run after each other, reusing them can save quite some time. The worker
+        processes keep running till the python process exits, or till they are
+        replaced by a new pool because e.g. another number of workers is needed or the
+        environment variables were changed.
+
+        Remarks:
+
+            - You can also set the option temporarily by using this function as a
+              context manager.
+            - You can also set the option by directly setting the environment variable
+              `GFO_REUSE_WORKER_POOL` to "TRUE" or "FALSE".
+
+        .. versionadded:: 0.12.0
+
+        Args:
+            enable (bool | None): If True, worker processes are reused between
+                operations. If False, new worker processes are started for each
+                operation. If None, the option is unset (so the default behavior is
+                used).
+
+        Examples:
+            If you want to change the default value of the option in general, you can
+            just call it as a function:
+
+            .. code-block:: python
+
+                gfo.options.set_reuse_worker_pool(True)
+
+
+            If you want to temporarily change the option, you can use it as a context
+            manager:
+
+            .. code-block:: python
+
+                with gfo.options.set_reuse_worker_pool(True):
+                    gfo.buffer(...)
+                    gfo.makevalid(...)
+
+        """
+        key = "GFO_REUSE_WORKER_POOL"
+        original_value = os.environ.get(key)
+        if enable is not None:
+            os.environ[key] = "TRUE" if enable else "FALSE"
+        elif key in os.environ:
+            del os.environ[key]
+
+        return _RestoreOriginalHandler(key, original_value)
+
+    @classproperty
+    def get_reuse_worker_pool(cls) -> bool:
+        """Should worker processes be reused between operations or not.
+
+        Returns:
+            bool: True to reuse worker processes. Defaults to False.
+        """
+        return _get_bool("GFO_REUSE_WORKER_POOL", default=False)
+
     @staticmethod
     def set_sliver_tolerance(tolerance: float | None) -> _RestoreOriginalHandler:
         """Tolerance to filter out slivers from overlay operations between polygons.
@@ -35,6 +35,16 @@ class GeofileTypeInfo:
 
 
 geofiletypes: dict[str, GeofileTypeInfo] = {}
+_geofiletype_for_suffix: dict[str, str] = {}
+_geofiletype_for_ogrdriver: dict[str, str] = {}
+
+# Drivers for suffixes that can be determined without opening the file.
+_drivers_for_suffix = {
+    ".gpkg": "GPKG",
+    ".gpkg.zip": "GPKG",
+    ".shp": "ESRI Shapefile",
+    ".shp.zip": "ESRI Shapefile",
+}
 
 
 def _init_geofiletypes() -> None:
@@ -71,6 +81,14 @@ def _init_geofiletypes() -> None:
                 suffixes_extrafiles=suffixes_extrafiles,
             )
 
+            # Add lookups on suffix and ogrdriver, the first match takes precedence
+            for suffix in suffixes:
+                _geofiletype_for_suffix.setdefault(suffix, row["geofiletype"])
+            if row["ogrdriver"] is not None:
+                _geofiletype_for_ogrdriver.setdefault(
+                    row["ogrdriver"], row["geofiletype"]
+                )
+
 
 class GeofileType(enum.Enum):
     """DEPRECATED Enumeration of relevant geo file types and their properties."""
@@ -97,18 +115,16 @@ class GeofileType(enum.Enum):
         """
 
         def get_geofiletype_for_suffix(suffix: str) -> GeofileType:
-            suffix_lower = suffix.lower()
-            for geofiletype, geofiletype_info in geofiletypes.items():
-                if suffix_lower in geofiletype_info.suffixes:
-                    return GeofileType[geofiletype]
-            raise ValueError(f"Unknown extension {suffix}")
+            geofiletype = _geofiletype_for_suffix.get(suffix.lower())
+            if geofiletype is None:
+                raise ValueError(f"Unknown extension {suffix}")
+            return GeofileType[geofiletype]
 
         def get_geofiletype_for_ogrdriver(ogrdriver: str) -> GeofileType:
-            for geofiletype, geofiletype_info in geofiletypes.items():
-                driver = geofiletype_info.ogrdriver
-                if driver is not None and driver == ogrdriver:
-                    return GeofileType[geofiletype]
-            raise ValueError(f"Unknown ogr driver {ogrdriver}")
+            geofiletype = _geofiletype_for_ogrdriver.get(ogrdriver)
+            if geofiletype is None:
+                raise ValueError(f"Unknown ogr driver {ogrdriver}")
+            return GeofileType[geofiletype]
 
         if value is None:
             return None
@@ -241,10 +257,9 @@ def get_driver(path: Union[str, "os.PathLike[Any]"]) -> str:
     """  # noqa: E501
     # gdal.OpenEx is relatively slow on windows, so for straightforward cases, avoid it.
     suffix = GeoPath(path).suffix_full.lower()
-    if suffix in (".gpkg", ".gpkg.zip"):
-        return "GPKG"
-    elif suffix in (".shp", ".shp.zip"):
-        return "ESRI Shapefile"
+    drivername = _drivers_for_suffix.get(suffix)
+    if drivername is not None:
+        return drivername
 
     def get_driver_for_path(
         input_path: Union[str, "os.PathLike[Any]"], driver_prefix: str | None
@@ -6,17 +6,18 @@ import logging.config
 import math
 import os
 import re
+import sqlite3
 import string
 import time
 import warnings
 from collections.abc import Iterable
 from concurrent import futures
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Literal
 
-import numpy as np
-import pandas as pd
+from osgeo import gdal
 
 import geofileops as gfo
 from geofileops import GeometryType, LayerInfo, PrimitiveType, fileops
@@ -42,6 +43,54 @@ from geofileops.util._geopath_util import GeoPath
 
 logger = logging.getLogger(__name__)
 
+
+def _batch_sqlite_options(
+    input_path: Path, output_path: Path, worker_type: str
+) -> dict[str, str]:
+    """Get gdal options to speed up the sqlite connections used to calculate a batch.
+
+    The pragma's are passed as open options, so they only apply to the connection to
+    the input file and to the temporary partial output file. For the output file, gdal
+    only uses them when it opens an existing file, so not when the file is created.
+    The gdal config options are process-wide, so they are only used if each batch is
+    calculated in its own process and if the user didn't set them already.
+
+    Args:
+        input_path (Path): the input file of the batch.
+        output_path (Path): the temporary partial output file of the batch.
+        worker_type (str): the type of workers used to calculate the batches.
+
+    Returns:
+        dict[str, str]: the options to pass to gdal.
+    """
+    options = {}
+    if GeofileInfo(input_path).is_spatialite_based:
+        options["INPUT_OPEN.PRELUDE_STATEMENTS"] = (
+            "PRAGMA temp_store=MEMORY; PRAGMA mmap_size=1073741824"
+        )
+    if GeofileInfo(output_path).is_spatialite_based:
+        # The partial output file is a throwaway file, so no journal is needed
+        options["DESTINATION_OPEN.PRELUDE_STATEMENTS"] = (
+            "PRAGMA synchronous=OFF; PRAGMA journal_mode=MEMORY"
+        )
+    if (
+        worker_type == "processes"
+        and gdal.GetConfigOption("OGR_SQLITE_SYNCHRONOUS") is None
+    ):
+        options["CONFIG.OGR_SQLITE_SYNCHRONOUS"] = "OFF"
+
+    return options
+
+
+@dataclass(slots=True)
+class _Batch:
+    """Info about a batch being calculated."""
+
+    layer: str
+    tmp_partial_output_path: Path
+    sql_stmt: str
+
+
 # -----------------------
 # Operations on one layer
 # -----------------------
@@ -200,6 +249,8 @@ def delete_duplicate_geometries(  # noqa: D417
         priority_column = "rowid"
     priority_order = "ASC" if priority_ascending else "DESC"
     input_layer_rtree = "rtree_{input_layer}_{geometrycolumn}"
+    # Remark: binary identical geometries are checked first, as this is a lot cheaper
+    # than the topological comparison done by ST_Equals.
     sql_template = f"""
         SELECT layer.{{geometrycolumn}} AS {{geometrycolumn}}
               {{columns_to_select_str}}
@@ -217,6 +268,7 @@ def delete_duplicate_geometries(  # noqa: D417
                      AND ST_MinY(layer.{{geometrycolumn}}) <= layer_sub_tree.maxy
                      AND ST_MaxY(layer.{{geometrycolumn}}) >= layer_sub_tree.miny
                      AND (layer.rowid = layer_sub.rowid
+                          OR layer.{{geometrycolumn}} = layer_sub.{{geometrycolumn}}
                           OR ST_Equals(
                                layer.{{geometrycolumn}}, layer_sub.{{geometrycolumn}}
                              )
@@ -724,15 +776,15 @@ def _single_layer_vector_operation(
                     ) sub_gridsize
             """
 
+        # Filtering away empty/null geometries and applying where_post is done in a
+        # single wrapping select to avoid an extra level of subqueries.
+        # Remark: "LIMIT -1 OFFSET 0" avoids that sqlite flattens the subquery, as the
+        # geometry expression would then be calculated twice.
+        where_conditions = []
+
         # If empty/null geometries don't need to be kept, filter them away
         if geom_selected and not keep_empty_geoms:
-            sql_template = f"""
-                SELECT * FROM
-                    ( {sql_template}
-                       LIMIT -1 OFFSET 0
-                    )
-                 WHERE {input_layer.geometrycolumn} IS NOT NULL
-            """
+            where_conditions.append(f"{input_layer.geometrycolumn} IS NOT NULL")
 
         # Prepare/apply where_post parameter
         if where_post is not None and not explodecollections:
@@ -740,15 +792,18 @@ def _single_layer_vector_operation(
             # If explodecollections would be True, we need to wait to apply the
             # where_post till after explodecollections is applied, so when appending the
             # partial results to the output file.
+            where_conditions.append(f"({where_post})")
+            # where_post has been applied already so set to None.
+            where_post = None
+
+        if len(where_conditions) > 0:
             sql_template = f"""
                 SELECT * FROM
                     ( {sql_template}
                        LIMIT -1 OFFSET 0
                     )
-                    WHERE {where_post}
+                 WHERE {" AND ".join(where_conditions)}
             """
-            # where_post has been applied already so set to None.
-            where_post = None
 
         # When null geometries are being kept, we need to make sure the geom in the
         # first row is not NULL because of a bug in gdal, so add ORDER BY as last step.
@@ -792,22 +847,22 @@ def _single_layer_vector_operation(
             initializer=_processing_util.initialize_worker,
             initargs=(worker_type,),
         ) as calculate_pool:
-            batches: dict[int, dict] = {}
+            batches: dict[int, _Batch] = {}
             future_to_batch_id = {}
             for batch_id in processing_params.batches:
-                batches[batch_id] = {}
-                batches[batch_id]["layer"] = output_layer
-
                 tmp_partial_output_path = (
                     tmp_dir / f"{GeoPath(output_path).stem}_{batch_id}.gpkg"
                 )
-                batches[batch_id]["tmp_partial_output_path"] = tmp_partial_output_path
 
                 # Fill out sql_template
                 sql_stmt = sql_template.format(
                     batch_filter=processing_params.batches[batch_id]["batch_filter"]
                 )
-                batches[batch_id]["sql_stmt"] = sql_stmt
+                batches[batch_id] = _Batch(
+                    layer=output_layer,
+                    tmp_partial_output_path=tmp_partial_output_path,
+                    sql_stmt=sql_stmt,
+                )
 
                 # If there is only one batch, it is faster to create the spatial index
                 # immediately. Otherwise no index needed, because partial files still
@@ -826,7 +881,14 @@ def _single_layer_vector_operation(
                     sql_dialect=sql_dialect,
                     explodecollections=explodecollections,
                     force_output_geometrytype=force_output_geometrytype,
-                    options={"LAYER_CREATION.SPATIAL_INDEX": create_spatial_index},
+                    options={
+                        "LAYER_CREATION.SPATIAL_INDEX": create_spatial_index,
+                        **_batch_sqlite_options(
+                            processing_params.batches[batch_id]["input1_path"],
+                            output_path=tmp_partial_output_path,
+                            worker_type=worker_type,
+                        ),
+                    },
                     preserve_fid=preserve_fid,
                 )
                 future = calculate_pool.submit(
@@ -851,6 +913,7 @@ def _single_layer_vector_operation(
             _general_helper.warn_if_low_mem(called_from=f"{operation_name}_loop")
 
             tmp_output_not_exists_or_empty = True
+            where_post_formatted = None
             for future in futures.as_completed(future_to_batch_id):
                 try:
                     _ = future.result()
@@ -864,7 +927,7 @@ def _single_layer_vector_operation(
                 # Start copy of the result to a common file
                 # Remark: give higher priority, because this is the slowest factor
                 batch_id = future_to_batch_id[future]
-                tmp_partial_output_path = batches[batch_id]["tmp_partial_output_path"]
+                tmp_partial_output_path = batches[batch_id].tmp_partial_output_path
                 nb_done += 1
 
                 # Normally all partial files should exist, but to be sure.
@@ -885,31 +948,39 @@ def _single_layer_vector_operation(
 
                     # If featurecount is 0, column types can be wrong, so in that case
                     # overwrite tmp_output if there are more batches.
-                    info = gfo.get_layerinfo(
-                        tmp_output_path, output_layer, raise_on_nogeom=False
-                    )
-                    if info.featurecount > 0:
-                        tmp_output_not_exists_or_empty = False
+                    # If this was the last batch, e.g. because there is only one batch,
+                    # the featurecount isn't needed anymore.
+                    if nb_done < nb_batches:
+                        info = gfo.get_layerinfo(
+                            tmp_output_path, output_layer, raise_on_nogeom=False
+                        )
+                        if info.featurecount > 0:
+                            tmp_output_not_exists_or_empty = False
 
                 else:
                     # Copy partial file contents to full tmp output file
-                    if where_post is not None:
-                        info = gfo.get_layerinfo(
-                            tmp_partial_output_path, output_layer, raise_on_nogeom=False
-                        )
-                        where_post = where_post.format(
-                            geometrycolumn=info.geometrycolumn
+                    # where_post only needs to be formatted once, as all partial files
+                    # have the same geometry column.
+                    if where_post is not None and where_post_formatted is None:
+                        geometrycolumn = None
+                        if "{geometrycolumn}" in where_post:
+                            info = gfo.get_layerinfo(
+                                tmp_partial_output_path,
+                                output_layer,
+                                raise_on_nogeom=False,
+                            )
+                            geometrycolumn = info.geometrycolumn
+                        where_post_formatted = where_post.format(
+                            geometrycolumn=geometrycolumn
                         )
 
                     # force_output_geometrytype and explodecollections have already been
                     # applied during calculation, so need to apply it here anymore.
-                    fileops.copy_layer(
-                        src=tmp_partial_output_path,
-                        dst=tmp_output_path,
-                        src_layer=output_layer,
-                        dst_layer=output_layer,
-                        write_mode="append",
-                        where=where_post,
+                    _append_partial_output(
+                        partial_path=tmp_partial_output_path,
+                        tmp_output_path=tmp_output_path,
+                        output_layer=output_layer,
+                        where=where_post_formatted,
                         create_spatial_index=False,
                         preserve_fid=preserve_fid,
                     )
@@ -2212,6 +2283,7 @@ def join_by_location(
     area_inters_column_in_output = ""
     area_inters_column_0_in_output = ""
     area_inters_filter = ""
+    area_inters_prefilter = ""
     if area_inters_column_name is not None or min_area_intersect is not None:
         if area_inters_column_name is not None:
             area_inters_column_name_touse = area_inters_column_name
@@ -2228,6 +2300,13 @@ def join_by_location(
                 f'WHERE sub_area."{area_inters_column_name_touse}" '
                 f">= {min_area_intersect}"
             )
+            if min_area_intersect > 0:
+                # The intersection can't be larger than the smallest of both geoms, so
+                # skip calculating the intersection if one of them is too small.
+                area_inters_prefilter = (
+                    f"AND ST_Area(sub_filter.geom) >= {min_area_intersect} "
+                    f"AND ST_Area(sub_filter.l2_geom) >= {min_area_intersect}"
+                )
 
     # Prepare spatial relation column and filter
     # As the query is used as the join criterium, it should not evaluate to True for
@@ -2278,6 +2357,7 @@ def join_by_location(
                    LIMIT -1 OFFSET 0
                   ) sub_filter
                WHERE {spatial_relations_filter}
+                 {area_inters_prefilter}
                LIMIT -1 OFFSET 0
               ) sub_area
            {area_inters_filter}
@@ -2794,6 +2874,16 @@ def identity(
     with _general_helper.create_gfo_tmp_dir("identity") as tmp_dir:
         # Prepare the input files
         logger.info("Step 1 of 4: prepare input files")
+        input1_path, input1_layer, input2_path, input2_layer = (
+            _convert_to_spatialite_based_once(
+                input1_path=input1_path,
+                input1_layer=input1_layer,
+                input2_path=input2_path,
+                input2_layer=input2_layer,
+                overlay_self=overlay_self,
+                tmp_dir=tmp_dir,
+            )
+        )
         input1_subdivided_path = _subdivide_layer(
             path=input1_path,
             layer=input1_layer,
@@ -2960,6 +3050,16 @@ def symmetric_difference(
     with _general_helper.create_gfo_tmp_dir("symmdiff") as tmp_dir:
         # Prepare the input files
         logger.info("Step 1 of 4: prepare input files")
+        input1_path, input1_layer, input2_path, input2_layer = (
+            _convert_to_spatialite_based_once(
+                input1_path=input1_path,
+                input1_layer=input1_layer,
+                input2_path=input2_path,
+                input2_layer=input2_layer,
+                overlay_self=overlay_self,
+                tmp_dir=tmp_dir,
+            )
+        )
         input1_subdivided_path = _subdivide_layer(
             path=input1_path,
             layer=input1_layer,
@@ -3133,6 +3233,16 @@ def union(
     with _general_helper.create_gfo_tmp_dir("union") as tmp_dir:
         # Prepare the input files
         logger.info("Step 1 of 5: prepare input files")
+        input1_path, input1_layer, input2_path, input2_layer = (
+            _convert_to_spatialite_based_once(
+                input1_path=input1_path,
+                input1_layer=input1_layer,
+                input2_path=input2_path,
+                input2_layer=input2_layer,
+                overlay_self=overlay_self,
+                tmp_dir=tmp_dir,
+            )
+        )
         input1_subdivided_path = _subdivide_layer(
             path=input1_path,
             layer=input1_layer,
@@ -3736,16 +3846,12 @@ def _two_layer_vector_operation(
             initargs=(worker_type,),
         ) as calculate_pool:
             # Start looping
-            batches: dict[int, dict] = {}
+            batches: dict[int, _Batch] = {}
             future_to_batch_id = {}
             for batch_id in processing_params.batches:
-                batches[batch_id] = {}
-                batches[batch_id]["layer"] = output_layer
-
                 tmp_partial_output_path = (
                     tmp_dir / f"{GeoPath(output_path).stem}_{batch_id}.gpkg"
                 )
-                batches[batch_id]["tmp_partial_output_path"] = tmp_partial_output_path
 
                 # Fill out final things in sql_template
                 sql_stmt = sql_template.format(
@@ -3755,7 +3861,11 @@ def _two_layer_vector_operation(
                     input4_databasename="{input4_databasename}",
                     batch_filter=processing_params.batches[batch_id]["batch_filter"],
                 )
-                batches[batch_id]["sqlite_stmt"] = sql_stmt
+                batches[batch_id] = _Batch(
+                    layer=output_layer,
+                    tmp_partial_output_path=tmp_partial_output_path,
+                    sql_stmt=sql_stmt,
+                )
 
                 # Remark: this temp file doesn't need spatial index
                 future = calculate_pool.submit(
@@ -3770,6 +3880,7 @@ def _two_layer_vector_operation(
                     use_ogr=use_ogr,
                     create_spatial_index=False,
                     column_datatypes=column_types,
+                    worker_type=worker_type,
                 )
                 future_to_batch_id[future] = batch_id
 
@@ -3802,7 +3913,7 @@ def _two_layer_vector_operation(
 
                 # If the calculate gave results, copy/append to output
                 batch_id = future_to_batch_id[future]
-                tmp_partial_output_path = batches[batch_id]["tmp_partial_output_path"]
+                tmp_partial_output_path = batches[batch_id].tmp_partial_output_path
                 nb_done += 1
 
                 # Normally all partial files should exist, but to be sure...
@@ -3837,15 +3948,13 @@ def _two_layer_vector_operation(
                         nb_batches == 1 and output_with_spatial_index
                     )
 
-                    fileops.copy_layer(
-                        src=tmp_partial_output_path,
-                        dst=tmp_output_path,
-                        src_layer=output_layer,
-                        dst_layer=output_layer,
-                        write_mode="append",
+                    _append_partial_output(
+                        partial_path=tmp_partial_output_path,
+                        tmp_output_path=tmp_output_path,
+                        output_layer=output_layer,
+                        where=where_post,
                         explodecollections=explode_append,
                         force_output_geometrytype=output_geometrytype_append,
-                        where=where_post,
                         create_spatial_index=create_spatial_index,
                         preserve_fid=False,
                     )
@@ -4138,6 +4247,7 @@ def _calculate_two_layers(
     create_spatial_index: bool,
     column_datatypes: dict,
     use_ogr: bool,
+    worker_type: str,
 ) -> None:
     if not use_ogr:
         # If explodecollections, write first to tmp file, then apply explodecollections
@@ -4167,7 +4277,14 @@ def _calculate_two_layers(
                 output_layer=output_layer,
                 explodecollections=explodecollections,
                 force_output_geometrytype=force_output_geometrytype,
-                options={"LAYER_CREATION.SPATIAL_INDEX": create_spatial_index},
+                options={
+                    "LAYER_CREATION.SPATIAL_INDEX": create_spatial_index,
+                    **_batch_sqlite_options(
+                        output_tmp_path,
+                        output_path=output_path,
+                        worker_type=worker_type,
+                    ),
+                },
                 preserve_fid=False,
             )
             gfo.remove(output_tmp_path)
@@ -4177,14 +4294,20 @@ def _calculate_two_layers(
         if len(input_databases) != 1:
             raise ValueError("use_ogr=True only supports one input file")
 
+        input_path = next(iter(input_databases.values()))
         _ogr_util.vector_translate(
-            input_path=next(iter(input_databases.values())),
+            input_path=input_path,
             output_path=output_path,
             sql_stmt=sql_stmt,
             output_layer=output_layer,
             explodecollections=explodecollections,
             force_output_geometrytype=force_output_geometrytype,
-            options={"LAYER_CREATION.SPATIAL_INDEX": create_spatial_index},
+            options={
+                "LAYER_CREATION.SPATIAL_INDEX": create_spatial_index,
+                **_batch_sqlite_options(
+                    input_path, output_path=output_path, worker_type=worker_type
+                ),
+            },
         )
 
 
@@ -4293,6 +4416,99 @@ def _convert_to_spatialite_based(
     return input1_path, input1_layer, input2_path, input2_layer
 
 
+def _convert_to_spatialite_based_once(
+    input1_path: Path,
+    input1_layer: LayerInfo,
+    input2_path: Path,
+    input2_layer: LayerInfo,
+    overlay_self: bool,
+    tmp_dir: Path,
+) -> tuple[Path, LayerInfo, Path, LayerInfo]:
+    """Convert the input files for an operation consisting of multiple steps.
+
+    The steps would otherwise each convert the input files again if they aren't
+    spatialite based.
+
+    Args:
+        input1_path (Path): path to the 1st input file.
+        input1_layer (LayerInfo): the layer info of the 1st input file.
+        input2_path (Path): path to the 2nd input file.
+        input2_layer (LayerInfo): the layer info of the 2nd input file.
+        overlay_self (bool): True if input2 is the same as input1.
+        tmp_dir (Path): the temporary directory of the operation. The files are
+            converted to a subdirectory, so they can't collide with the outputs of the
+            steps.
+
+    Returns:
+        the input1_path, input1_layer, input2_path, input2_layer
+    """
+    prepared_dir = tmp_dir / "prepared_input"
+    prepared_dir.mkdir(parents=True, exist_ok=True)
+
+    if overlay_self:
+        # input2 is the same as input1, so it only needs to be converted once.
+        input1_path, input1_layer, _, _ = _convert_to_spatialite_based(
+            input1_path=input1_path,
+            input1_layer=input1_layer,
+            tmp_dir=prepared_dir,
+            unzip_gpkg=True,
+        )
+        return input1_path, input1_layer, input1_path, input1_layer
+
+    return _convert_to_spatialite_based(  # type: ignore[return-value]
+        input1_path=input1_path,
+        input1_layer=input1_layer,
+        tmp_dir=prepared_dir,
+        unzip_gpkg=True,
+        input2_path=input2_path,
+        input2_layer=input2_layer,
+    )
+
+
+def _append_partial_output(
+    partial_path: Path,
+    tmp_output_path: Path,
+    output_layer: str,
+    where: str | None = None,
+    explodecollections: bool = False,
+    force_output_geometrytype: GeometryType | None = None,
+    create_spatial_index: bool | None = False,
+    preserve_fid: bool | None = None,
+) -> None:
+    """Append a partial output file to the temporary output file.
+
+    Because the temporary output file is discarded anyway if something goes wrong, if
+    the data is appended directly in sqlite this is done with the SPEED profile: no
+    journal and no syncs to disk.
+
+    Args:
+        partial_path (Path): the partial output file to append.
+        tmp_output_path (Path): the temporary output file to append to.
+        output_layer (str): the layer name in both files.
+        where (str, optional): filter to apply when appending. Defaults to None.
+        explodecollections (bool, optional): True to explode the collections when
+            appending. Defaults to False.
+        force_output_geometrytype (GeometryType, optional): geometry type to force
+            when appending. Defaults to None.
+        create_spatial_index (bool, optional): True to create a spatial index if the
+            temporary output file doesn't exist yet. Defaults to False.
+        preserve_fid (bool, optional): True to preserve the fids. Defaults to None.
+    """
+    fileops._copy_layer(
+        src=partial_path,
+        dst=tmp_output_path,
+        src_layer=output_layer,
+        dst_layer=output_layer,
+        write_mode="append",
+        explodecollections=explodecollections,
+        force_output_geometrytype=force_output_geometrytype,
+        where=where,
+        create_spatial_index=create_spatial_index,
+        preserve_fid=preserve_fid,
+        profile=_sqlite_util.SqliteProfile.SPEED,
+    )
+
+
 def _finalize_output(
     output_tmp_path: Path,
     output_path: Path,
@@ -4418,12 +4634,13 @@ def _prepare_processing_params(
                     )
                  WHERE (rownumber = 1 OR rownumber % {nb_rows_per_batch} = 0)
             """
-            batch_info_df = gfo.read_file(
-                path=input1_path, sql_stmt=sql_stmt, sql_dialect="SQLITE"
-            )
-
-            batch_info_df.reset_index(names=["batch_id"], inplace=True)
-            nb_batches = len(batch_info_df)
+            start_ids = [row[0] for row in _read_rows(input1_path, sql_stmt)]
+            if len(start_ids) < nb_batches:
+                logger.info(
+                    f"nb_batches reduced from {nb_batches} to {len(start_ids)} because "
+                    "the pieces of a subdivided row must be in the same batch"
+                )
+            nb_batches = len(start_ids)
 
         else:
             # Determine the min_rowid and max_rowid
@@ -4433,60 +4650,55 @@ def _prepare_processing_params(
                 UNION ALL
                 SELECT MAX(rowid) minmax_rowid FROM "{input1_layer.name}"
             """
-            batch_info_df = gfo.read_file(
-                path=input1_path, sql_stmt=sql_stmt, sql_dialect="SQLITE"
-            )
-            min_rowid = pd.to_numeric(batch_info_df["minmax_rowid"][0]).item()
-            max_rowid = pd.to_numeric(batch_info_df["minmax_rowid"][1]).item()
+            rows = _read_rows(input1_path, sql_stmt)
+            min_rowid, max_rowid = (int(row[0]) for row in rows)
 
             # Determine the exact batches to use
             if ((max_rowid - min_rowid) / nb_rows_input_layer) < 1.1:
                 # If the rowid's are quite consecutive, use an imperfect, but
                 # fast distribution in batches
-                batch_info_list = []
-                start_id = min_rowid
                 offset_per_batch = round((max_rowid - min_rowid) / nb_batches)
-                for batch_id in range(nb_batches):
-                    batch_info_list.append((batch_id, start_id))
-                    start_id += offset_per_batch
-
-                batch_info_df = pd.DataFrame(
-                    batch_info_list, columns=["batch_id", "start_id"]
-                )
+                start_ids = [
+                    min_rowid + batch_id * offset_per_batch
+                    for batch_id in range(nb_batches)
+                ]
             else:
                 # The rowids are not consecutive, so determine the optimal rowid
                 # ranges for each batch so each batch has same number of elements
                 # Remark: - this might take some seconds for larger datasets!
-                #         - (batch_id - 1) AS id to make the id zero-based
+                #         - ROW_NUMBER() is one-based!
+                #         - filtering on the row number avoids the sort of all rows
+                #           that a GROUP BY on an NTILE() batch_id needs.
+                #         - the start row numbers are spread evenly over the rows, so
+                #           exactly nb_batches batches are created.
+                start_rownumbers = [
+                    batch_id * nb_rows_input_layer // nb_batches + 1
+                    for batch_id in range(nb_batches)
+                ]
                 sql_stmt = f"""
-                    SELECT (batch_id - 1) AS batch_id
-                        ,MIN(rowid) AS start_id
-                    FROM
-                        ( SELECT rowid
-                                ,NTILE({nb_batches}) OVER (ORDER BY rowid) batch_id
+                    SELECT start_id FROM
+                        ( SELECT rowid AS start_id
+                                ,ROW_NUMBER() OVER (ORDER BY rowid) AS rownumber
                             FROM "{input1_layer.name}"
                         )
-                    GROUP BY batch_id;
+                     WHERE rownumber IN ({", ".join(map(str, start_rownumbers))})
+                     ORDER BY rownumber
                 """
-                batch_info_df = gfo.read_file(path=input1_path, sql_stmt=sql_stmt)
+                start_ids = [row[0] for row in _read_rows(input1_path, sql_stmt)]
 
         # Prepare the layer alias to use in the batch filter
         layer_alias_d = ""
         if input1_layer_alias is not None:
             layer_alias_d = f"{input1_layer_alias}."
 
-        # The end_id is the start_id of the next batch - 1
-        batch_info_df["end_id"] = batch_info_df["start_id"].shift(-1) - 1
-
         # Now loop over all batch ranges to build up the necessary filters
-        for batch_id, start_id, end_id in batch_info_df.itertuples(index=False):
+        for batch_id, start_id in enumerate(start_ids):
             # The batch filter
             batch_filter = f"{layer_alias_d}{batch_filter_column} >= {int(start_id)}"
-            if not np.isnan(end_id).item():
-                # There is an end_id specified, so add it to the filter
-                batch_filter += (
-                    f" AND {layer_alias_d}{batch_filter_column} <= {int(end_id)}"
-                )
+            if batch_id < len(start_ids) - 1:
+                # The end_id is the start_id of the next batch - 1
+                end_id = int(start_ids[batch_id + 1]) - 1
+                batch_filter += f" AND {layer_alias_d}{batch_filter_column} <= {end_id}"
             batch_filter = f"AND ({batch_filter}) "
 
             # Fill out the batch properties
@@ -4512,6 +4724,33 @@ def _prepare_processing_params(
     return returnvalue
 
 
+def _read_rows(path: Path, sql_stmt: str) -> list[tuple]:
+    """Read the rows returned by a (small) sql query on a file.
+
+    For local GeoPackage and SQLite files the query is executed directly in sqlite,
+    which avoids the overhead of reading the result via gdal into a DataFrame. If that
+    fails, e.g. because the query uses functions that are only available via gdal, the
+    query is executed via gdal after all.
+
+    Args:
+        path (Path): the file to run the query on.
+        sql_stmt (str): the sql query to run, in sqlite dialect.
+
+    Returns:
+        list[tuple]: the rows returned by the query.
+    """
+    if path.suffix.lower() in (".gpkg", ".sqlite") and path.exists():
+        try:
+            return _sqlite_util.read_rows(path, sql_stmt)
+        except RuntimeError as ex:
+            if not isinstance(ex.__cause__, sqlite3.OperationalError):
+                raise
+            logger.debug(f"Read rows directly in sqlite failed, retry with gdal: {ex}")
+
+    result_df = gfo.read_file(path=path, sql_stmt=sql_stmt, sql_dialect="SQLITE")
+    return list(result_df.itertuples(index=False, name=None))
+
+
 def _determine_nb_batches(
     nb_rows_input_layer: int,
     nb_parallel: int | None,
@@ -199,6 +199,42 @@ class ColumnFormatter:
         return f",{', '.join(columns_from_subselect)}"
 
 
+def quote_identifier(identifier: str, dialect: str = "SQLITE") -> str:
+    """Quote an identifier (e.g. a table or column name) for use in sql statements.
+
+    For the SQLITE dialect, double quotes in the identifier are escaped by doubling
+    them. For the OGRSQL dialect the identifier is only enclosed in double quotes, as
+    gdal doesn't support escaped double quotes in all OGRSQL statements, e.g. in
+    ALTER TABLE.
+
+    Args:
+        identifier (str): the identifier to quote.
+        dialect (str, optional): the sql dialect the identifier will be used in:
+            "SQLITE" or "OGRSQL". Defaults to "SQLITE".
+
+    Returns:
+        str: the quoted identifier.
+    """
+    if dialect == "OGRSQL":
+        return f'"{identifier}"'
+
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def quote_string(value: str) -> str:
+    """Quote a string literal for use in sql statements.
+
+    Single quotes in the value are escaped by doubling them.
+
+    Args:
+        value (str): the value to quote.
+
+    Returns:
+        str: the quoted string literal.
+    """
+    return "'" + value.replace("'", "''") + "'"
+
+
 def columns_quoted(columns: list[str]) -> str:
     if len(columns) == 0:
         return ""
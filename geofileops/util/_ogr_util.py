@@ -394,6 +394,10 @@ def vector_translate(
     for option_name, value in gdal_options["INPUT_OPEN"].items():
         input_open_options.append(f"{option_name}={value!s}")
 
+    # Destination dataset open options: only used if the output file already exists
+    for option_name, value in gdal_options["DESTINATION_OPEN"].items():
+        args.extend(["-doo", f"{option_name}={value!s}"])
+
     # Output file parameters
     # Get driver for the output_path
     output_info = fileops._geofileinfo.get_geofileinfo(output_path)
@@ -684,6 +688,7 @@ def vector_translate(
             input_has_geometry_attribute,
             input_has_geom_attribute,
         )
+        fileops._invalidate_file_cache(output_path)
 
         if gdal_cpl_log_path.exists():
             # Truncate the cpl log file already, because sometimes it is locked and
@@ -1,16 +1,25 @@
 """Module containing utilities regarding processes."""
 
+import atexit
 import multiprocessing
 import multiprocessing.context
 import os
+import threading
 from collections.abc import Callable
 from concurrent import futures
 from types import TracebackType
+from typing import Any
 
 import psutil
 
+from geofileops.helpers._options import ConfigOptions
+
 WORKER_TYPES = {"threads", "processes"}
 
+# Process pool that is reused between operations if GFO_REUSE_WORKER_POOL is enabled.
+_shared_pool: dict[str, Any] = {"pool": None, "key": None, "in_use": False}
+_shared_pool_lock = threading.Lock()
+
 
 class PooledExecutorFactory:
     """Context manager to create a pooled executor.
@@ -25,6 +34,8 @@ class PooledExecutorFactory:
             used. If None, "forkserver" will be used on linux to avoid risks on getting
             deadlocks. Defaults to None.
 
+    If processes are used and the `GFO_REUSE_WORKER_POOL` option is enabled, the
+    process pool is not shut down on exit but kept to be reused by the next operation.
     """
 
     def __init__(
@@ -54,6 +65,7 @@ class PooledExecutorFactory:
             # On linux, overrule default to "forkserver" to avoid risks to deadlocks
             self.mp_context = multiprocessing.get_context("forkserver")
         self.pool: futures.Executor | None = None
+        self.pool_shared = False
 
     def __enter__(self) -> futures.Executor:
         if self.worker_type == "threads":
@@ -63,12 +75,16 @@ class PooledExecutorFactory:
                 initargs=self.initargs,
             )
         elif self.worker_type == "processes":
-            self.pool = futures.ProcessPoolExecutor(
-                max_workers=self.max_workers,
-                initializer=self.initializer,
-                initargs=self.initargs,
-                mp_context=self.mp_context,
-            )
+            if ConfigOptions.get_reuse_worker_pool:
+                self.pool = self._get_shared_pool()
+                self.pool_shared = self.pool is not None
+            if self.pool is None:
+                self.pool = futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=self.initializer,
+                    initargs=self.initargs,
+                    mp_context=self.mp_context,
+                )
         else:
             raise ValueError(
                 f"Invalid worker_type: {self.worker_type}. "
@@ -83,8 +99,61 @@ class PooledExecutorFactory:
         value: Exception | None,
         traceback: TracebackType | None,
     ) -> None:
-        if self.pool is not None:
+        if self.pool is None:
+            return
+        if not self.pool_shared:
             self.pool.shutdown(wait=True)
+            return
+
+        with _shared_pool_lock:
+            if value is not None:
+                # The pool can be broken, so don't reuse it after an error.
+                self.pool.shutdown(wait=True, cancel_futures=True)
+                _shared_pool["pool"] = None
+            _shared_pool["in_use"] = False
+
+    def _get_shared_pool(self) -> futures.ProcessPoolExecutor | None:
+        """Get the shared process pool, (re)creating it if needed.
+
+        Returns:
+            futures.ProcessPoolExecutor | None: the shared pool or None if it is already
+                in use, e.g. by another thread.
+        """
+        # The worker processes only know the environment variables that were set when
+        # they were started, so the environment is part of the key.
+        key = (
+            self.max_workers,
+            self.initializer,
+            self.initargs,
+            self.mp_context,
+            frozenset(os.environ.items()),
+        )
+        with _shared_pool_lock:
+            if _shared_pool["in_use"]:
+                return None
+            if _shared_pool["pool"] is not None and _shared_pool["key"] != key:
+                _shared_pool["pool"].shutdown(wait=True)
+                _shared_pool["pool"] = None
+            if _shared_pool["pool"] is None:
+                _shared_pool["pool"] = futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=self.initializer,
+                    initargs=self.initargs,
+                    mp_context=self.mp_context,
+                )
+                _shared_pool["key"] = key
+
+            _shared_pool["in_use"] = True
+            return _shared_pool["pool"]
+
+
+@atexit.register
+def _shutdown_shared_pool() -> None:
+    """Shut down the shared process pool if it exists."""
+    with _shared_pool_lock:
+        if _shared_pool["pool"] is not None:
+            _shared_pool["pool"].shutdown(wait=True, cancel_futures=True)
+            _shared_pool["pool"] = None
 
 
 def initialize_worker(worker_type: str, nice_value: int = 15) -> None:
@@ -198,6 +198,7 @@ def add_gpkg_ogr_contents(
         # If no existing connection was passed, close the connection
         if not isinstance(database, sqlite3.Connection):
             conn.close()
+            gfo.fileops._invalidate_file_cache(database)
             conn = None  # type: ignore[assignment]
 
 
@@ -696,6 +697,7 @@ def copy_table(
     finally:
         conn.close()
         conn = None  # type: ignore[assignment]
+        gfo.fileops._invalidate_file_cache(output_path)
 
 
 def create_table_as_sql(
@@ -973,6 +975,7 @@ def create_table_as_sql(
         if conn is not None:
             conn.close()
             conn = None
+        gfo.fileops._invalidate_file_cache(output_path)
 
 
 def execute_sql(
@@ -1003,6 +1006,7 @@ def execute_sql(
         raise RuntimeError(f"Error executing {sql}") from ex
     finally:
         conn.close()
+        gfo.fileops._invalidate_file_cache(path)
 
 
 def get_gpkg_content(
@@ -1203,6 +1207,44 @@ def get_gpkg_ogr_contents(path: Path) -> dict[str, dict]:
     return contents_dict
 
 
+def has_gpkg_rtree_index(path: Path, table_name: str) -> bool | None:
+    """Check if a table in a geopackage has an rtree spatial index.
+
+    Args:
+        path (Path): file path to the geopackage.
+        table_name (str): the table to check. The comparison is case insensitive.
+
+    Returns:
+        bool | None: True if the table has an rtree spatial index, False if it doesn't.
+            None if the table isn't a table with a geometry column.
+    """
+    # Connect to database file, we don't need spatialite here
+    conn = sqlite3.connect(path)
+
+    sql = None
+    try:
+        sql = """
+            SELECT table_name, column_name FROM gpkg_geometry_columns
+             WHERE table_name = ? COLLATE NOCASE;
+        """
+        row = conn.execute(sql, (table_name,)).fetchone()
+        if row is None:
+            return None
+
+        sql = """
+            SELECT COUNT(*) FROM sqlite_master
+             WHERE type = 'table' AND name = ? COLLATE NOCASE;
+        """
+        count = conn.execute(sql, (f"rtree_{row[0]}_{row[1]}",)).fetchone()[0]
+    except Exception as ex:  # pragma: no cover
+        raise RuntimeError(f"Error executing {sql}") from ex
+    finally:
+        conn.close()
+        conn = None  # type: ignore[assignment]
+
+    return count > 0
+
+
 def get_tables(path: Path) -> list[str]:
     """List all tables in the database.
 
@@ -1229,6 +1271,30 @@ def get_tables(path: Path) -> list[str]:
     return tables
 
 
+def read_rows(path: Path, sql_stmt: str) -> list[tuple]:
+    """Execute a select query on the database and return the resulting rows.
+
+    Args:
+        path (Path): file path to the database.
+        sql_stmt (str): the select query to execute.
+
+    Returns:
+        list[tuple]: the rows returned by the query.
+    """
+    # Connect to database file, we don't need spatialite here
+    conn = sqlite3.connect(path)
+
+    try:
+        rows = conn.execute(sql_stmt).fetchall()
+    except Exception as ex:  # pragma: no cover
+        raise RuntimeError(f"Error executing {sql_stmt}") from ex
+    finally:
+        conn.close()
+        conn = None  # type: ignore[assignment]
+
+    return rows
+
+
 def get_gpkg_total_bounds(
     database: Union[Path, "os.PathLike[Any]", sqlite3.Connection],
     table_name: str,
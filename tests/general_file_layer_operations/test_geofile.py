@@ -31,7 +31,7 @@ from geofileops._compat import (
     PYOGRIO_GTE_012,
 )
 from geofileops.helpers._options import ConfigOptions
-from geofileops.util import _geofileinfo, _geoseries_util
+from geofileops.util import _geofileinfo, _geoseries_util, _sqlite_util
 from geofileops.util._geopath_util import GeoPath
 from tests import test_helper
 from tests.test_helper import (
@@ -576,6 +576,46 @@ def test_cmp(tmp_path, suffix, keep_permissions):
     assert gfo.cmp(src2, dst) is False
 
 
+def test_cmp_shp_content_differs(tmp_path):
+    """Files of equal size with a different content are compared in threads."""
+    src = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path, suffix=".shp")
+    dst = tmp_path / "dst" / src.name
+    dst.parent.mkdir()
+    gfo.copy(src, dst)
+    assert gfo.cmp(src, dst) is True
+
+    # Change the last byte of the .dbf file of dst, keeping its size
+    dst_dbf = dst.with_suffix(".dbf")
+    data = bytearray(dst_dbf.read_bytes())
+    data[-2] = (data[-2] + 1) % 256
+    dst_dbf.write_bytes(data)
+    src_dbf_stat = src.with_suffix(".dbf").stat()
+    assert dst_dbf.stat().st_size == src_dbf_stat.st_size
+
+    # Make sure the mtimes differ, also on file systems with a coarse mtime resolution
+    os.utime(dst_dbf, ns=(src_dbf_stat.st_atime_ns, src_dbf_stat.st_mtime_ns + 10**9))
+
+    assert gfo.cmp(src, dst) is False
+
+
+def test_cmp_chmod_difference_compares_equal(tmp_path):
+    """Files with equal type, size and mtime but other permissions compare equal.
+
+    Like filecmp, the content isn't compared if the signatures are equal, and the
+    permissions of the files aren't part of the signature.
+    """
+    src = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    dst = tmp_path / "output.gpkg"
+    data = bytearray(src.read_bytes())
+    data[-1] = (data[-1] + 1) % 256
+    dst.write_bytes(data)
+    dst.chmod(0o444)
+    src_stat = src.stat()
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+    assert gfo.cmp(src, dst) is True
+
+
 def test_convert(tmp_path):
     """Test the convert function.
 
@@ -1460,6 +1500,37 @@ def test_copy_error(tmp_path):
         gfo.copy(src, dst)
 
 
+def test_copy_move_remove_extrafiles_uppercase(tmp_path):
+    """Extra files with a suffix in another case should be found as well."""
+    src_dir = tmp_path / "src"
+    src = test_helper.get_testfile("polygon-parcel", dst_dir=src_dir, suffix=".shp")
+    for suffix in [".shx", ".dbf"]:
+        src.with_suffix(suffix).rename(src.with_suffix(suffix.upper()))
+
+    # Copy
+    dst = tmp_path / "copy" / "output.shp"
+    dst.parent.mkdir()
+    gfo.copy(src, dst)
+    assert dst.exists()
+    assert dst.with_suffix(".shx").exists()
+    assert dst.with_suffix(".dbf").exists()
+    assert src.with_suffix(".SHX").exists()
+
+    # Move
+    dst_dir = tmp_path / "move"
+    dst_dir.mkdir()
+    gfo.move(src, dst_dir)
+    assert not src.with_suffix(".SHX").exists()
+    assert not src.with_suffix(".DBF").exists()
+    moved = dst_dir / src.name
+    assert moved.with_suffix(".SHX").exists()
+    assert moved.with_suffix(".DBF").exists()
+
+    # Remove
+    gfo.remove(moved)
+    assert list(dst_dir.iterdir()) == []
+
+
 @pytest.mark.parametrize("suffix", SUFFIXES_FILEOPS)
 def test_drop_column(tmp_path, suffix):
     # Prepare test data
@@ -1503,6 +1574,19 @@ def test_get_crs_bad_prj(tmp_path):
         assert file_corrected.read() == fileops.PRJ_EPSG_31370
 
 
+def test_get_crs_cache(tmp_path):
+    src = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path, suffix=".shp")
+    crs = gfo.get_crs(src)
+    assert crs.to_epsg() == 31370
+    crs_cached = gfo.get_crs(src)
+    assert crs_cached == crs
+    assert crs_cached is not crs
+
+    # If the .prj file changes, the crs should be read again
+    src.with_suffix(".prj").unlink()
+    assert gfo.get_crs(src) is None
+
+
 def test_get_crs_invalid_params():
     src = test_helper.get_testfile("polygon-parcel")
     with pytest.raises(ValueError, match="Layer not_existing not found in file"):
@@ -1650,6 +1734,89 @@ def test_get_layerinfo_datasource():
     datasource = None
 
 
+@pytest.mark.parametrize("suffix", [".gpkg", ".shp"])
+def test_get_layerinfo_cache(tmp_path, suffix):
+    """Test that get_layerinfo results are cached, but not when the file changed."""
+    src = test_helper.get_testfile("polygon-parcel", suffix=suffix, dst_dir=tmp_path)
+
+    layerinfo = gfo.get_layerinfo(src)
+    cache_keys = _file_cache_keys(src)
+    assert len(cache_keys) > 0
+    assert gfo.get_layerinfo(str(src)).name == layerinfo.name
+    assert _file_cache_keys(src) == cache_keys
+
+    # Changing the layerinfo returned should not change the cached layerinfo.
+    column = next(iter(layerinfo.columns))
+    del layerinfo.columns[column]
+    assert column in gfo.get_layerinfo(src).columns
+
+    # The crs isn't changed in place, so it is shared instead of copied.
+    assert gfo.get_layerinfo(src).crs is gfo.get_layerinfo(src).crs
+
+    # After a change to the file, the cached layerinfo should not be used anymore.
+    gfo.add_column(src, name="new_column", type="TEXT")
+    layerinfo_changed = gfo.get_layerinfo(src)
+    assert layerinfo_changed is not layerinfo
+    assert "new_column" in layerinfo_changed.columns
+
+
+def test_get_layerinfo_cache_invalidated(tmp_path):
+    """Writes via remove_spatial_index or directly in sqlite invalidate the cache."""
+    src = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    layer = gfo.get_only_layer(src)
+
+    gfo.get_layerinfo(src)
+    assert len(_file_cache_keys(src)) > 0
+    gfo.remove_spatial_index(src)
+    assert len(_file_cache_keys(src)) == 0
+
+    gfo.get_layerinfo(src)
+    _sqlite_util.execute_sql(
+        src, f'ALTER TABLE "{layer}" ADD COLUMN new_column TEXT', use_spatialite=False
+    )
+    assert "new_column" in gfo.get_layerinfo(src).columns
+
+
+def test_file_cache_key_gpkg_wal(tmp_path):
+    """The key of a GeoPackage changes if its write-ahead log file changes."""
+    path = tmp_path / "test.gpkg"
+    path.write_bytes(b"gpkg")
+    key = fileops._file_cache_key(path)
+
+    Path(f"{path}-wal").write_bytes(b"wal")
+    assert fileops._file_cache_key(path) != key
+
+
+def test_file_cache_key_directory(tmp_path):
+    """The key of a directory based file changes if a file in the directory changes."""
+    path = tmp_path / "test.gdb"
+    path.mkdir()
+    (path / "a00000001.gdbtable").write_bytes(b"table")
+    key = fileops._file_cache_key(path)
+
+    stat = (path / "a00000001.gdbtable").stat()
+    os.utime(
+        path / "a00000001.gdbtable", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9)
+    )
+    assert fileops._file_cache_key(path) != key
+
+
+def _file_cache_keys(path: Path) -> list[tuple]:
+    return [key for key in fileops._file_cache if key[0] == path.absolute()]
+
+
+def test_get_layerinfos(tmp_path):
+    src1 = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    src2 = test_helper.get_testfile("point", dst_dir=tmp_path, suffix=".shp")
+
+    layerinfos = gfo.get_layerinfos([src1, str(src2)], max_workers=2)
+
+    assert len(layerinfos) == 2
+    assert layerinfos[0].name == gfo.get_layerinfo(src1).name
+    assert layerinfos[1].name == gfo.get_layerinfo(src2).name
+    assert gfo.get_layerinfos([]) == []
+
+
 @pytest.mark.xfail
 def test_get_layerinfo_curve():
     """Don't get this test to pass when running all tests.
@@ -1799,6 +1966,17 @@ def test_listlayers_errors(suffix):
         _ = gfo.listlayers(path)
 
 
+def test_listlayers_cache(tmp_path):
+    """Layer names are cached, but the cache is invalidated when the file changes."""
+    src = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    assert gfo.listlayers(src) == ["parcels"]
+    assert gfo.get_only_layer(src) == "parcels"
+
+    gfo.rename_layer(src, new_layer="parcels_renamed")
+    assert gfo.listlayers(src) == ["parcels_renamed"]
+    assert gfo.get_only_layer(src) == "parcels_renamed"
+
+
 @pytest.mark.parametrize(
     "suffix, only_spatial_layers, expected",
     [
@@ -55,6 +55,17 @@ def test_create_spatial_index(request, tmp_path, suffix, read_only):
         gfo.create_spatial_index(path=test_path, layer=layer, exist_ok=True)
 
 
+def test_create_spatial_index_exist_ok_cache(tmp_path):
+    """If the index exists already, the cached file metadata stays valid."""
+    src = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    gfo.get_layerinfo(src)
+    cache_keys = [key for key in fileops._file_cache if key[0] == src.absolute()]
+    assert len(cache_keys) > 0
+
+    gfo.create_spatial_index(src, exist_ok=True)
+    assert all(key in fileops._file_cache for key in cache_keys)
+
+
 @pytest.mark.parametrize("suffix", [s for s in SUFFIXES_FILEOPS if s != ".csv"])
 @pytest.mark.parametrize("read_only", [True, False])
 def test_create_spatial_index_force_rebuild(request, tmp_path, suffix, read_only):
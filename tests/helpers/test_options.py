@@ -70,6 +70,8 @@ def test_get_bool_invalidvalue():
         ("GFO_REMOVE_TEMP_FILES", "TRUe", True),
         ("GFO_REMOVE_TEMP_FILES", "FALse", False),
         ("GFO_REMOVE_TEMP_FILES", None, True),
+        ("GFO_REUSE_WORKER_POOL", "TRUe", True),
+        ("GFO_REUSE_WORKER_POOL", None, False),
         ("GFO_WORKER_TYPE", "THReads", "threads"),
         ("GFO_WORKER_TYPE", "PROcesses", "processes"),
         ("GFO_WORKER_TYPE", "AUTo", "auto"),
@@ -89,6 +91,8 @@ def test_get_option(key, value, expected):
             result = ConfigOptions.get_on_data_error
         elif key == "GFO_REMOVE_TEMP_FILES":
             result = ConfigOptions.get_remove_temp_files
+        elif key == "GFO_REUSE_WORKER_POOL":
+            result = ConfigOptions.get_reuse_worker_pool
         elif key == "GFO_WORKER_TYPE":
             result = ConfigOptions.get_worker_type
         else:
@@ -393,6 +397,21 @@ def test_set_remove_temp_files() -> None:
     assert key not in os.environ
 
 
+def test_set_reuse_worker_pool() -> None:
+    """Test the reuse_worker_pool option setter."""
+    # Make sure the environment variable is not set at the start of the test
+    key = "GFO_REUSE_WORKER_POOL"
+    if key in os.environ:
+        del os.environ[key]
+
+    # Test setting the option temporarily using context manager
+    with gfo.options.set_reuse_worker_pool(True):
+        assert os.environ[key] == "TRUE"
+
+    # After exiting the context manager, the environment variable should be removed
+    assert key not in os.environ
+
+
 def test_set_sliver_tolerance() -> None:
     """Test the sliver_tolerance option setter."""
     # Make sure the environment variable is not set at the start of the test
@@ -1903,6 +1903,61 @@ def test_select_two_layers_batch_filter(
         )
 
 
+@pytest.mark.parametrize("where_post", [None, "l1_id > 0"])
+def test_select_two_layers_explodecollections(tmp_path, where_post):
+    """Explode multi-part, single-part geometries and collections."""
+    # Prepare test data
+    box1 = shapely.box(0, 0, 10, 10)
+    box2 = shapely.box(20, 0, 30, 10)
+    input1_path = tmp_path / "input1.gpkg"
+    input1_gdf = gpd.GeoDataFrame(
+        {
+            "id": [1, 2, 3, 4, 5],
+            "geometry": [
+                sh_geom.MultiPolygon([box1, box2]),
+                box1,
+                None,
+                sh_geom.Polygon(),
+                sh_geom.GeometryCollection([box1, sh_geom.Point(50, 50)]),
+            ],
+        },
+        crs=31370,
+    )
+    gfo.to_file(input1_gdf, input1_path)
+    input2_path = tmp_path / "input2.gpkg"
+    input2_gdf = gpd.GeoDataFrame({"id": [1], "geometry": [box1]}, crs=31370)
+    gfo.to_file(input2_gdf, input2_path)
+    output_path = tmp_path / "output.gpkg"
+
+    sql_stmt = """
+        SELECT layer1.{input1_geometrycolumn} AS geom
+              {layer1_columns_prefix_alias_str}
+          FROM {input1_databasename}."{input1_layer}" layer1
+          CROSS JOIN {input2_databasename}."{input2_layer}" layer2
+         WHERE 1=1
+           {batch_filter}
+    """
+    gfo.select_two_layers(
+        input1_path,
+        input2_path,
+        output_path,
+        sql_stmt,
+        explodecollections=True,
+        where_post=where_post,
+        nb_parallel=2,
+        batchsize=3,
+    )
+
+    # Check result: one row per part
+    output_gdf = gfo.read_file(output_path)
+    nb_rows = output_gdf["l1_id"].value_counts().to_dict()
+    assert nb_rows[1] == 2
+    assert nb_rows[2] == 1
+    assert nb_rows[5] == 2
+    exploded_gdf = output_gdf[output_gdf["l1_id"].isin([1, 2, 5])]
+    assert set(exploded_gdf.geom_type) == {"Polygon", "Point"}
+
+
 def test_select_two_layers_no_databasename_placeholder(tmp_path):
     # Prepare test data
     input1_path = test_helper.get_testfile("polygon-parcel")
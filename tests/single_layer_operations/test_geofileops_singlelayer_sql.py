@@ -75,6 +75,24 @@ def test_delete_duplicate_geoms(tmp_path, priority_column, priority_ascending, s
     assert_geodataframe_equal(result_gdf, expected_gdf)
 
 
+def test_buffer_where_post_escaped_braces(tmp_path):
+    """Escaped braces in where_post are unescaped when it is formatted."""
+    input_path = test_helper.get_testfile("polygon-parcel")
+    output_path = tmp_path / "output.gpkg"
+    geoops_sql.buffer(
+        input_path=input_path,
+        output_path=output_path,
+        distance=1,
+        explodecollections=True,
+        where_post="length('{{}}') = 2 AND ST_Area({geometrycolumn}) > 0",
+        nb_parallel=2,
+        batchsize=10,
+    )
+
+    # If the braces would not be unescaped, no rows would be retained
+    assert gfo.get_layerinfo(output_path).featurecount > 0
+
+
 def test_delete_duplicate_geoms_notexact(tmp_path):
     """Test if the test of being duplicates is tolerant enough for small differences.
 
@@ -54,6 +54,129 @@ def test_determine_nb_batches(
     assert exp_nb_batches == res_nb_batches
 
 
+@pytest.mark.parametrize(
+    "suffix, worker_type, exp_options",
+    [
+        (
+            ".gpkg",
+            "threads",
+            ["INPUT_OPEN.PRELUDE_STATEMENTS", "DESTINATION_OPEN.PRELUDE_STATEMENTS"],
+        ),
+        (
+            ".gpkg",
+            "processes",
+            [
+                "INPUT_OPEN.PRELUDE_STATEMENTS",
+                "DESTINATION_OPEN.PRELUDE_STATEMENTS",
+                "CONFIG.OGR_SQLITE_SYNCHRONOUS",
+            ],
+        ),
+        (".shp", "threads", ["DESTINATION_OPEN.PRELUDE_STATEMENTS"]),
+    ],
+)
+def test_batch_sqlite_options(suffix, worker_type, exp_options):
+    options = _geoops_sql._batch_sqlite_options(
+        GeoPath(f"input{suffix}"),
+        output_path=GeoPath("output.gpkg"),
+        worker_type=worker_type,
+    )
+    assert list(options) == exp_options
+
+
+def test_read_rows_fallback():
+    """If the query fails in plain sqlite, it is executed via gdal."""
+    path = test_helper.get_testfile("polygon-parcel")
+    layerinfo = gfo.get_layerinfo(path)
+
+    # ST_MinX is not available in plain sqlite, only via gdal
+    sql_stmt = f"""
+        SELECT MIN(ST_MinX({layerinfo.geometrycolumn})) AS minx
+          FROM "{layerinfo.name}"
+    """
+    rows = _geoops_sql._read_rows(path, sql_stmt)
+
+    assert len(rows) == 1
+    assert rows[0][0] == pytest.approx(layerinfo.total_bounds[0])
+
+
+def test_prepare_processing_params_sparse_rowids(tmp_path):
+    """The batches should cover all rows if the rowids are not consecutive."""
+    path = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    layer = gfo.get_only_layer(path)
+    gfo.execute_sql(path, sql_stmt=f'DELETE FROM "{layer}" WHERE rowid % 3 <> 0')
+    layerinfo = gfo.get_layerinfo(path)
+
+    processing_params = _geoops_sql._prepare_processing_params(
+        input1_path=path, input1_layer=layerinfo, nb_parallel=2, batchsize=10
+    )
+
+    assert processing_params is not None
+    _, exp_nb_batches = _geoops_sql._determine_nb_batches(
+        nb_rows_input_layer=layerinfo.featurecount,
+        nb_parallel=2,
+        batchsize=10,
+        is_twolayer_operation=False,
+    )
+    assert exp_nb_batches > 1
+    assert len(processing_params.batches) == exp_nb_batches
+    nb_rows_batches = 0
+    for batch in processing_params.batches.values():
+        sql_stmt = f"""
+            SELECT * FROM "{layer}" WHERE 1=1 {batch["batch_filter"]}
+        """
+        batch_gdf = gfo.read_file(path, sql_stmt=sql_stmt, sql_dialect="SQLITE")
+        assert len(batch_gdf) <= 10
+        nb_rows_batches += len(batch_gdf)
+    assert nb_rows_batches == layerinfo.featurecount
+
+
+@pytest.mark.parametrize("create_spatial_index", [True, False])
+def test_append_partial_output(tmp_path, create_spatial_index):
+    """Appending partial outputs, the second time directly in sqlite."""
+    partial_path = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    layer = gfo.get_only_layer(partial_path)
+    tmp_output_path = tmp_path / "output.gpkg"
+
+    # The first append creates the output file
+    _geoops_sql._append_partial_output(
+        partial_path=partial_path,
+        tmp_output_path=tmp_output_path,
+        output_layer=layer,
+        create_spatial_index=create_spatial_index,
+    )
+    assert gfo.get_layerinfo(tmp_output_path, layer).featurecount == 48
+    assert gfo.has_spatial_index(tmp_output_path, layer) == create_spatial_index
+
+    # The second append is done directly in sqlite
+    _geoops_sql._append_partial_output(
+        partial_path=partial_path,
+        tmp_output_path=tmp_output_path,
+        output_layer=layer,
+        where="OIDN > 0",
+        create_spatial_index=create_spatial_index,
+    )
+    output_info = gfo.get_layerinfo(tmp_output_path, layer)
+    assert output_info.featurecount == 96
+    assert output_info.total_bounds == gfo.get_layerinfo(partial_path).total_bounds
+    assert gfo.has_spatial_index(tmp_output_path, layer) == create_spatial_index
+
+
+def test_append_partial_output_error(tmp_path):
+    """If appending directly in sqlite fails, it is not retried with gdal."""
+    partial_path = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    layer = gfo.get_only_layer(partial_path)
+    tmp_output_path = tmp_path / "output.gpkg"
+    gfo.copy(partial_path, tmp_output_path)
+
+    with pytest.raises(RuntimeError, match="not_existing_column"):
+        _geoops_sql._append_partial_output(
+            partial_path=partial_path,
+            tmp_output_path=tmp_output_path,
+            output_layer=layer,
+            where="not_existing_column > 0",
+        )
+
+
 @pytest.mark.parametrize(
     "input1_suffix, input2_suffix, output1_suffix, output2_suffix, unzip_gpkg",
     [
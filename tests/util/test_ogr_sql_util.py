@@ -137,3 +137,26 @@ def test_get_unique_fid_aliases():
     # The function only tries up to 100 suffixes
     with pytest.raises(ValueError, match="Could not find unique fid alias"):
         _ogr_sql_util.get_unique_fid_alias("fid", [f"fid_{i}" for i in range(1, 100)])
+
+
+@pytest.mark.parametrize(
+    "identifier, dialect, exp_quoted",
+    [
+        ("layer", "SQLITE", '"layer"'),
+        ('my "layer"', "SQLITE", '"my ""layer"""'),
+        ("it's", "SQLITE", '"it\'s"'),
+        ("layer", "OGRSQL", '"layer"'),
+        ("my layer", "OGRSQL", '"my layer"'),
+        ("it's", "OGRSQL", '"it\'s"'),
+    ],
+)
+def test_quote_identifier(identifier, dialect, exp_quoted):
+    assert _ogr_sql_util.quote_identifier(identifier, dialect) == exp_quoted
+
+
+@pytest.mark.parametrize(
+    "value, exp_quoted",
+    [("layer", "'layer'"), ("it's", "'it''s'"), ('my "layer"', "'my \"layer\"'")],
+)
+def test_quote_string(value, exp_quoted):
+    assert _ogr_sql_util.quote_string(value) == exp_quoted
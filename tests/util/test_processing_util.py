@@ -4,6 +4,7 @@ Tests for functionalities in _processing_util.
 
 import os
 
+import geofileops as gfo
 from geofileops.util import _processing_util
 
 
@@ -42,3 +43,25 @@ def test_processnice():
 
     # Reset niceness to original value before test
     _processing_util.setprocessnice(nice_orig)
+
+
+def test_pooledexecutorfactory_reuse_worker_pool():
+    with gfo.options.set_reuse_worker_pool(True):
+        with _processing_util.PooledExecutorFactory(max_workers=2) as pool:
+            assert pool.submit(sum, [1, 2]).result() == 3
+        with _processing_util.PooledExecutorFactory(max_workers=2) as pool2:
+            assert pool2 is pool
+
+            # If the shared pool is in use, a new pool is created
+            with _processing_util.PooledExecutorFactory(max_workers=2) as pool3:
+                assert pool3 is not pool
+
+        # If the number of workers is different, the pool is replaced
+        with _processing_util.PooledExecutorFactory(max_workers=1) as pool4:
+            assert pool4 is not pool
+
+    # Without the option, a new pool is created
+    with _processing_util.PooledExecutorFactory(max_workers=1) as pool5:
+        assert pool5 is not pool4
+
+    _processing_util._shutdown_shared_pool()
@@ -656,6 +656,28 @@ def test_get_gpkg_total_bounds(empty):
             assert round(value) == round(layer_info.total_bounds[idx])
 
 
+def test_has_gpkg_rtree_index(tmp_path):
+    test_path = test_helper.get_testfile("polygon-parcel", dst_dir=tmp_path)
+    layer = gfo.get_only_layer(test_path)
+
+    assert sqlite_util.has_gpkg_rtree_index(test_path, layer) is True
+    assert sqlite_util.has_gpkg_rtree_index(test_path, layer.upper()) is True
+    assert sqlite_util.has_gpkg_rtree_index(test_path, "not_existing") is None
+
+    gfo.remove_spatial_index(test_path, layer)
+    assert sqlite_util.has_gpkg_rtree_index(test_path, layer) is False
+
+
+def test_read_rows():
+    test_path = test_helper.get_testfile("polygon-parcel")
+    layer = gfo.get_only_layer(test_path)
+
+    sql_stmt = f'SELECT MIN(rowid), MAX(rowid) FROM "{layer}"'
+    rows = sqlite_util.read_rows(test_path, sql_stmt)
+
+    assert rows == [(1, 49)]
+
+
 def test_load_spatialite():
     test_path = test_helper.get_testfile("polygon-parcel")
     conn = sqlite3.connect(test_path)